@@ -0,0 +1,56 @@
+"""Run the benchmarks from the python directory:
+
+python -m benchmarks.run --save       # write a new baseline
+python -m benchmarks.run              # compare against the baseline
+"""
+
+import argparse
+import sys
+from benchmarks.workloads import WORKLOADS
+from pathlib import Path
+from utils import benchmark
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="workloads, all by default")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = []
+    print(
+        f"{'workload':40} {'items/s':>12} {'p50 [ms]':>10} {'p99 [ms]':>10} {'peak [MB]':>10}"
+    )
+    for name in args.names or WORKLOADS:
+        run, items = WORKLOADS[name]()
+        result = benchmark.measure(name, run, items, runs=args.runs)
+        results.append(result)
+        print(
+            f"{name:40} {result.throughput:12.0f} {result.p50 * 1e3:10.2f}"
+            f" {result.p99 * 1e3:10.2f} {result.peak_memory:10.2f}"
+        )
+
+    if args.save:
+        benchmark.save(args.baseline, results)
+        print("Baseline written to", args.baseline)
+        return 0
+
+    if not args.baseline.exists():
+        print("No baseline at", args.baseline, "- run with --save to write one")
+        return 0
+
+    regressions = benchmark.compare(
+        results, benchmark.load(args.baseline), args.tolerance
+    )
+    for name, metric, ratio in regressions:
+        print(f"REGRESSION {name}: {metric} x{ratio:.2f}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
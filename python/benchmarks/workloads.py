@@ -0,0 +1,381 @@
+"""Representative workloads of the standards modules. Each builder prepares
+its inputs from a fixed seed and returns the workload and its item count."""
+
+import numpy as np
+from en_12831_1.methodology import BuildingElement, DesignDay, Surface, H_T_ix
+from en_12831_1.model import BuildingModel, ElementTransmission, HeatLoadCoefficients
+from en_12831_1.network import EXTERIOR_NODE, ThermalNetwork
+from en_12831_1.ventilation import ZoneVentilation
+from iso_6946.methodology import (
+    AirCavity,
+    Material,
+    Construction,
+    ConstructionTable,
+    Transmittance,
+)
+from iso_11855.methodology import (
+    EmbeddedRadiantSystem,
+    EmbeddedRadiantSystemBatch,
+    heat_transmission_cache,
+)
+from iso_13370.methodology import (
+    Ground,
+    HeatedBasementBatch,
+    MonthlyGroundHeatFlow,
+    SlabOnGroundFloor,
+    SlabOnGroundFloorBatch,
+    SuspendedFloorBatch,
+    UnheatedBasementBatch,
+)
+import en_12831_3.functions as dhw
+from pathlib import Path
+
+WORKLOADS = {}
+DIRECTIONS = ["upwards", "horizontal", "downwards"]
+
+
+def workload(name):
+    def register(builder):
+        WORKLOADS[name] = builder
+        return builder
+
+    return register
+
+
+def random_constructions(n, rng):
+    constructions = []
+    for i in range(n):
+        materials = [
+            Material(f"M{j}", thickness, conductivity)
+            for j, (thickness, conductivity) in enumerate(
+                zip(rng.uniform(0.01, 0.3, 5), rng.uniform(0.03, 2.0, 5))
+            )
+        ]
+        constructions.append(Construction(f"C{i}", materials[: rng.integers(1, 6)]))
+    return constructions
+
+
+@workload("iso_6946.Transmittance")
+def transmittance(n=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    constructions = random_constructions(n, rng)
+    directions = rng.choice(DIRECTIONS, n)
+
+    def run():
+        return [
+            Transmittance(c.name, c, direction)
+            for c, direction in zip(constructions, directions)
+        ]
+
+    return run, n
+
+
+@workload("iso_6946.ConstructionTable")
+def construction_table(n=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    offsets = np.concatenate([[0], np.cumsum(rng.integers(1, 6, n))])
+    thickness = rng.uniform(0.01, 0.3, offsets[-1])
+    conductivity = rng.uniform(0.03, 2.0, offsets[-1])
+    direction = rng.integers(len(DIRECTIONS), size=n)
+
+    def run():
+        return ConstructionTable(offsets, thickness, conductivity, direction)
+
+    return run, n
+
+
+@workload("iso_6946.AirCavity")
+def air_cavity(n=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    thickness = rng.uniform(0.005, 0.3, n)
+    direction = rng.integers(len(DIRECTIONS), size=n)
+    deltaT = rng.uniform(1, 15, n)
+    epsilon_1 = rng.uniform(0.05, 0.9, n)
+    width = rng.uniform(0.01, 2.0, n)
+
+    def run():
+        return AirCavity(thickness, direction, deltaT, epsilon_1, width=width)
+
+    return run, n
+
+
+@workload("iso_13370.SlabOnGroundFloor")
+def slab_on_ground_floor(n=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    ground = Ground("Clay or silt", conductivity=1.5)
+    construction = Construction("Slab", Material("Concrete", 0.2, 1.7))
+    area = rng.uniform(20, 2000, n)
+    perimeter = 4 * np.sqrt(area) * rng.uniform(1, 1.5, n)
+    d_w_e = rng.uniform(0.2, 0.5, n)
+    R_f_sog = rng.uniform(0, 5, n)
+
+    def run():
+        return [
+            SlabOnGroundFloor(f"F{i}", *x, ground, construction, d, R)
+            for i, (*x, d, R) in enumerate(zip(area, perimeter, d_w_e, R_f_sog))
+        ]
+
+    return run, n
+
+
+@workload("iso_13370.SlabOnGroundFloorBatch")
+def slab_on_ground_floor_batch(n=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    area = rng.uniform(20, 2000, n)
+    perimeter = 4 * np.sqrt(area) * rng.uniform(1, 1.5, n)
+    d_w_e = rng.uniform(0.2, 0.5, n)
+    R_f_sog = rng.uniform(0, 5, n)
+
+    def run():
+        return SlabOnGroundFloorBatch(area, perimeter, 1.5, d_w_e, R_f_sog)
+
+    return run, n
+
+
+@workload("iso_13370.MixedFoundations")
+def mixed_foundations(n=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    area = rng.uniform(20, 500, n)
+    perimeter = 4 * np.sqrt(area) * rng.uniform(1, 1.5, n)
+    conductivity = rng.choice([1.5, 2.0, 3.5], n)
+    foundation = rng.integers(3, size=n)
+    batches = (SuspendedFloorBatch, HeatedBasementBatch, UnheatedBasementBatch)
+
+    def run():
+        floors = [
+            batch(area[i], perimeter[i], conductivity[i])
+            for batch, i in zip(batches, (foundation == k for k in range(3)))
+        ]
+        return MonthlyGroundHeatFlow.from_floors(floors)
+
+    return run, n
+
+
+@workload("iso_13370.MonthlyGroundHeatFlow")
+def monthly_ground_heat_flow(n=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    H_g = rng.uniform(10, 100, n)
+    H_pi = rng.uniform(50, 300, n)
+    H_pe = rng.uniform(5, 50, n)
+    t_e_amp = rng.uniform(5, 15, n)
+
+    def run():
+        return MonthlyGroundHeatFlow(H_g, H_pi, H_pe, t_e_amp=t_e_amp)
+
+    return run, n
+
+
+@workload("en_12831_1.H_T_ix")
+def transmission_of_building(rooms=200, elements_per_room=8, seed=0):
+    rng = np.random.default_rng(seed)
+    design_day = DesignDay("Synthetic", -20, 7.6)
+    constructions = random_constructions(20, rng)
+
+    class Neighbour:
+        def __init__(self, t_int_i):
+            self.t_int_i = t_int_i
+
+    elements = []
+    for i in range(rooms):
+        t_int_i = rng.choice([16.0, 20.0, 24.0])
+        for k in range(elements_per_room):
+            surface = Surface(
+                f"S{i}.{k}", rng.uniform(2, 30), 0, rng.choice(DIRECTIONS)
+            )
+            construction = constructions[rng.integers(len(constructions))]
+            if rng.random() < 0.5:
+                element = BuildingElement(
+                    f"E{i}.{k}", construction, "exterior", None, surface
+                )
+            else:
+                neighbour = Neighbour(rng.choice([12.0, 16.0, 20.0]))
+                element = BuildingElement(
+                    f"E{i}.{k}", construction, "adjacent room", neighbour, surface
+                )
+            elements.append((t_int_i, element))
+
+    def run():
+        return [H_T_ix(design_day, t_int_i, element) for t_int_i, element in elements]
+
+    return run, len(elements)
+
+
+@workload("en_12831_1.ElementTransmission")
+def element_transmission(n=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    A_k = rng.uniform(2, 30, n)
+    U_k = rng.uniform(0.1, 2.0, n)
+    boundary = rng.integers(5, size=n)
+    t_int_i = rng.choice([16.0, 20.0, 24.0], n)
+    t_x = rng.choice([5.0, 12.0, 16.0, 20.0], n)
+    direction = rng.choice([1, 2], n)
+    z = rng.uniform(0, 3, n)
+    P = rng.uniform(0, 40, n)
+
+    def run():
+        return ElementTransmission(
+            A_k,
+            U_k,
+            boundary,
+            -20,
+            t_int_i,
+            t_x,
+            7.6,
+            dU_TB=0.05,
+            direction=direction,
+            z=z,
+            P=P,
+        )
+
+    return run, n
+
+
+@workload("en_12831_1.ThermalNetwork")
+def thermal_network(spaces=5_000, connections_per_space=4, seed=0):
+    rng = np.random.default_rng(seed)
+    n = spaces * connections_per_space
+    # every space touches the exterior and some other spaces
+    node_a = np.concatenate([np.arange(spaces), rng.integers(spaces, size=n)])
+    node_b = np.concatenate(
+        [np.full(spaces, EXTERIOR_NODE), rng.integers(spaces, size=n)]
+    )
+    H_T_12 = rng.uniform(1, 20, len(node_a))
+    t_int = np.where(rng.random(spaces) < 0.3, np.nan, 20.0)
+
+    def run():
+        return ThermalNetwork(node_a, node_b, H_T_12, t_int, -20)
+
+    return run, spaces
+
+
+@workload("en_12831_1.HeatLoadCoefficients")
+def heat_load_coefficients(rooms=2_000, elements_per_room=8, climates=2_000, seed=0):
+    rng = np.random.default_rng(seed)
+    n = rooms * elements_per_room
+    coefficients = HeatLoadCoefficients(
+        element_room=rng.integers(rooms, size=n),
+        A_k=rng.uniform(2, 30, n),
+        U_k=rng.uniform(0.1, 2.0, n),
+        boundary=rng.integers(5, size=n),
+        t_int_i=rng.choice([16.0, 20.0, 24.0], rooms),
+        t_x=rng.choice([5.0, 12.0, 16.0], n),
+        direction=rng.choice([1, 2], n),
+        z=rng.uniform(0, 3, n),
+        P=20,
+        H_V_i=rng.uniform(0, 30, rooms),
+    )
+    t_e = rng.uniform(-30, 0, climates)
+    t_e_ann = rng.uniform(5, 12, climates)
+
+    def run():
+        return coefficients.design_loads(t_e, t_e_ann)
+
+    return run, rooms * climates
+
+
+@workload("en_12831_1.ZoneVentilation")
+def zone_ventilation(rooms=20_000, zones=500, seed=0):
+    rng = np.random.default_rng(seed)
+    room_zone = rng.integers(zones, size=rooms)
+    t_star_int_i = rng.choice([16.0, 20.0, 24.0], rooms)
+    V_i = rng.uniform(20, 200, rooms)
+    A_env_i = rng.uniform(0, 40, rooms)
+    q_v_sup_i = rng.uniform(0, 100, rooms)
+    q_v_exh_i = rng.uniform(0, 100, rooms)
+
+    def run():
+        return ZoneVentilation(
+            room_zone,
+            -20,
+            3.0,
+            t_star_int_i,
+            V_i,
+            A_env_i=A_env_i,
+            q_v_sup_i=q_v_sup_i,
+            q_v_exh_i=q_v_exh_i,
+            eta_rec_z=0.75,
+        )
+
+    return run, rooms
+
+
+@workload("en_12831_1.BuildingModel")
+def building_model(rooms=20_000, elements_per_room=8, zones=200, seed=0):
+    rng = np.random.default_rng(seed)
+    n = rooms * elements_per_room
+    element_room = rng.integers(rooms, size=n)
+    element_boundary = rng.integers(5, size=n)
+    H_T_ix = rng.uniform(0, 20, n)
+    room_zone = rng.integers(zones, size=rooms)
+    t_int_i = rng.choice([16.0, 20.0, 24.0], rooms)
+    area = rng.uniform(5, 50, rooms)
+    Phi_V_i = rng.uniform(0, 500, rooms)
+
+    def run():
+        return BuildingModel(
+            element_room,
+            element_boundary,
+            H_T_ix,
+            room_zone,
+            -20,
+            t_int_i,
+            area,
+            Phi_V_i,
+            phi_hu_i=8,
+        )
+
+    return run, rooms
+
+
+def radiant_sweep():
+    W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
+    s_u = [0.03, 0.045, 0.065]
+    R_k_B = [0.0, 0.05, 0.1, 0.15]
+    grid = np.meshgrid(["A", "B", "D"], W, s_u, R_k_B, indexing="ij")
+    return [x.ravel() for x in grid]
+
+
+@workload("iso_11855.EmbeddedRadiantSystem")
+def embedded_radiant_system():
+    sweep = list(zip(*radiant_sweep()))
+
+    def run():
+        heat_transmission_cache.clear()
+        return [
+            EmbeddedRadiantSystem(system_type=t, W=W, s_u=s_u, R_k_B=R_k_B)
+            for t, W, s_u, R_k_B in sweep
+        ]
+
+    return run, len(sweep)
+
+
+@workload("iso_11855.EmbeddedRadiantSystemBatch")
+def embedded_radiant_system_batch():
+    system_type, W, s_u, R_k_B = radiant_sweep()
+
+    def run():
+        return EmbeddedRadiantSystemBatch(
+            system_type=system_type,
+            W=W.astype(float),
+            s_u=s_u.astype(float),
+            R_k_B=R_k_B.astype(float),
+        )
+
+    return run, len(W)
+
+
+@workload("en_12831_3.minute_profiles")
+def minute_profiles(buildings=20, days=365, seed=0):
+    rng = np.random.default_rng(seed)
+    path = Path(dhw.__file__).with_name("load_profiles_for_building_categories.csv")
+    x_h = np.loadtxt(path, delimiter=",", skiprows=1)[:, 1:]  # [%] of the day
+    category = rng.integers(x_h.shape[1], size=buildings)
+    Q_W_b = rng.uniform(5, 50, (buildings, days))  # Daily energy need [kWh]
+
+    def run():
+        # hourly shares spread evenly over the minutes of the hour
+        x_min = np.repeat(x_h[:, category].T / 60, 60, axis=1)
+        Q_W_b_t = dhw.Q_W_b_t2(Q_W_b[:, :, None], x_min[:, None, :])
+        return dhw.Q_W_b_i(Q_W_b_t.reshape(buildings, -1).T)
+
+    return run, buildings * days * 1440
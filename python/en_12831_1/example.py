@@ -1,5 +1,5 @@
-from en_12831.methodology import *
-from en_12831.functions import *
+from en_12831_1.methodology import *
+from en_12831_1.functions import *
 from iso_6946.methodology import *
 from pprint import pprint
 
@@ -23,3 +23,106 @@ print(H_T_ie)
 Phi_T_i = round(H_T_ie[1] * (20 - (-20)), 0)
 
 print(f"Phi_T_i {Phi_T_i} W")
+
+# retrofit what-if, only the elements of the changed construction are recomputed
+room1 = Room("room1", 100, 4, 400, BE1, design_day=winter_design_day, t_int_i=20)
+building = Building("building", rooms=[room1])
+print(f"Phi_T_build {building.transmission_heat_loss:.0f} W")
+
+material2.thickness = 0.2
+print(f"Phi_T_build {building.transmission_heat_loss:.0f} W after adding 10 cm of EPS")
+
+# rooms, zones and the building aggregated from index arrays
+from en_12831_1.model import BuildingModel
+
+room2 = Room("room2", 20, 3, 60, BE1, design_day=winter_design_day, t_int_i=24)
+model = BuildingModel.from_rooms(
+    [room1, room2], winter_design_day, room_zone=[0, 1], phi_hu_i=8
+)
+print("Phi_HL_i", model.Phi_HL_i.round(0), "W")
+print("Phi_HL_z", model.Phi_HL_z.round(0), "W")
+print(f"Phi_HL_build {model.Phi_HL_build:.0f} W")
+
+# transmission of all elements of the rooms in one pass
+from en_12831_1.model import ElementTransmission
+
+transmission = ElementTransmission.from_elements(
+    [BE1, BE1], winter_design_day, [20, 24]
+)
+print("f_ix_k", transmission.f_ix_k, "H_T_ie", transmission.H_T_ie, "W/K")
+
+# temperature of an unheated staircase solved from the heat balance of the spaces
+from en_12831_1.network import ThermalNetwork
+
+staircase = Room("staircase", 15, 3, 45, [], t_int_i=20)
+staircase.building_elements = [
+    BuildingElement(
+        "SE", construction1, "exterior", None, Surface("SE", 30, 0, "horizontal")
+    )
+]
+BE2 = BuildingElement(
+    "BE2",
+    construction1,
+    "adjacent unheated room",
+    staircase,
+    Surface("BE2", 12, 0, "horizontal"),
+)
+room3 = Room("room3", 20, 3, 60, [BE1, BE2], design_day=winter_design_day)
+network = ThermalNetwork.from_rooms([room3], winter_design_day, unheated=[staircase])
+network.apply()
+print(f"t_staircase {staircase.t_int_i:.1f} *C, Phi_T_room3 {room3.Phi_T_i:.0f} W")
+
+# an unheated basement on the ground, the heat from room4 above it balances
+# the losses of the basement to the exterior and the ground
+basement = Room("basement", 20, 2.5, 50, [], design_day=winter_design_day)
+slab = FloorSlab("BF", Surface("BF", 20, 18, "downwards"), 18, 2.0)
+basement.building_elements = [
+    BuildingElement("BF", construction1, "ground", slab, slab.surface),
+    BuildingElement(
+        "BW", construction1, "exterior", None, Surface("BW", 10, 0, "horizontal")
+    ),
+]
+BE3 = BuildingElement(
+    "BE3",
+    construction1,
+    "adjacent unheated room",
+    basement,
+    Surface("BE3", 20, 0, "downwards"),
+)
+room4 = Room("room4", 20, 3, 60, [BE3], design_day=winter_design_day)
+network = ThermalNetwork.from_rooms([room4], winter_design_day, unheated=[basement])
+network.apply()
+print(f"t_basement {basement.t_int_i:.1f} *C, Phi_T_room4 {room4.Phi_T_i:.0f} W")
+assert abs(room4.Phi_T_i - basement.Phi_T_i) < 1e-6
+
+# design loads of the rooms for several climates from one coefficient matrix
+from en_12831_1.model import HeatLoadCoefficients, climate_arrays
+
+climates = [
+    winter_design_day,
+    DesignDay("Pierwsza strefa klimatyczna", -16, 7.9),
+    DesignDay("Piata strefa klimatyczna", -24, 5.5),
+]
+coefficients = HeatLoadCoefficients.from_rooms([room1, room2, room3])
+Phi_T_i = coefficients.transmission_losses(*climate_arrays(climates))
+print("Phi_T_i", Phi_T_i.round(0))
+# room3 follows the staircase temperature set by the network
+assert abs(room3.Phi_T_i - Phi_T_i[2, 0]) < 1e-6
+
+# ventilation of the rooms, natural against balanced ventilation with heat recovery
+from en_12831_1.ventilation import ZoneVentilation
+
+rooms = dict(room_zone=[0, 0, 0], t_e=-20, q_env_50=3.0, V_i=[400, 60, 60])
+natural = ZoneVentilation(**rooms, A_env_i=[140, 20, 30])
+balanced = ZoneVentilation(
+    **rooms,
+    A_env_i=[140, 20, 30],
+    q_v_sup_i=[150, 30, 0],
+    q_v_exh_i=[0, 0, 180],
+    eta_rec_z=0.8,
+)
+print("Phi_V_i natural", natural.Phi_V_i.round(0), "W")
+print("Phi_V_i balanced", balanced.Phi_V_i.round(0), "W")
+print(
+    f"Phi_HL_build {BuildingModel.from_rooms([room1, room2, room3], winter_design_day, Phi_V_i=balanced.Phi_V_i).Phi_HL_build:.0f} W"
+)
@@ -138,7 +138,7 @@ def Phi_V_i2(
     t_transfer_ij,
 ):
     """Function 17 - Ventilation heat loss of the room."""
-    q_max = max(q_v_env_i + q_v_open_i, q_v_min_i - q_v_techn_i)
+    q_max = np.maximum(q_v_env_i + q_v_open_i, q_v_min_i - q_v_techn_i)
     q_sum = (
         q_max * (t_star_int_i - t_e)
         + q_v_sup_i * (t_star_int_i - t_rec_z)
@@ -150,9 +150,8 @@ def Phi_V_i2(
 def q_v_env_i(q_v_inf_add_z, q_v_env_z, q_v_leak_ATD_i, f_dir):
     """Function 18 - External air volume flow into the room (i) through the building envelope."""
     return (
-        q_v_inf_add_z / q_v_env_z * max(q_v_env_z, q_v_leak_ATD_i * f_dir)
-        + q_v_env_z
-        - q_v_inf_add_z * q_v_leak_ATD_i / q_v_env_z
+        q_v_inf_add_z / q_v_env_z * np.minimum(q_v_env_z, q_v_leak_ATD_i * f_dir)
+        + (q_v_env_z - q_v_inf_add_z) / q_v_env_z * q_v_leak_ATD_i
     )
 
 
@@ -183,13 +182,13 @@ def a_ATD_z(q_v_ATD_50_z, q_env_50, A_env_z):
 
 def q_v_techn_i(q_v_sup_i, q_v_transfer_ij, q_v_exh_i, q_v_comb_i):
     """Function 23 - Technical air volume flow into the room (i)."""
-    return max(q_v_sup_i + q_v_transfer_ij, q_v_exh_i + q_v_comb_i)
+    return np.maximum(q_v_sup_i + q_v_transfer_ij, q_v_exh_i + q_v_comb_i)
 
 
 def q_v_env_z(q_v_exh_z, q_v_comb_z, q_v_sup_z, q_v_inf_add_z):
     """Function 24 - External air volume flow into the ventilation zone (z)
     through the building envelope"""
-    return max(q_v_exh_z + q_v_comb_z - q_v_sup_z, 0) + q_v_inf_add_z
+    return np.maximum(q_v_exh_z + q_v_comb_z - q_v_sup_z, 0) + q_v_inf_add_z
 
 
 # Functions 25, 26, 27 are just the sum functions
@@ -207,7 +206,7 @@ def f_e_z(
     """Function 29 - Adjustement factor taking into account the additional
     pressure difference due to unbalanced ventilation."""
     x = (q_v_exh_z + q_v_comb_z - q_v_sup_z) / (q_env_50 * A_env_z + q_v_ATD_50_z)
-    return 1 / ((1 + f_fac_z / f_qv_z) * x**2)
+    return 1 / (1 + f_fac_z / f_qv_z * x**2)
 
 
 def q_v_ATD_50_z(q_v_ATD_design_z, dp_ATD_design_z=4, v_leak_z=0.67):
@@ -245,9 +244,7 @@ def t_rec_z(t_e_0, eta_rec_z, t_exh_z):
 def t_exh_z(q_v_exh_i, t_star_int_i):
     """Function 38 - Temperature of the exhaust air from the zone (z)."""
     if np.iterable(q_v_exh_i):
-        numerator = [q * t for q, t in zip(q_v_exh_i, t_star_int_i)]
-        denominator = sum(q_v_exh_i)
-        return numerator / denominator
+        return np.dot(q_v_exh_i, t_star_int_i) / np.sum(q_v_exh_i)
     else:
         return t_star_int_i
 
@@ -370,11 +367,11 @@ f_tann = 1.45
 
 
 def f_GW(h_GW):
-    """Water table correction factor."""
-    if h_GW <= 1:
-        return 1.15
-    else:
-        1.00
+    """Water table correction factor.
+    Arguments:
+    h_GW - depth of the ground water table below the floor [m]
+    """
+    return np.where(np.less_equal(h_GW, 1), 1.15, 1.00)[()]
 
 
 def c_eff(category):
@@ -385,7 +382,7 @@ def c_eff(category):
         return 15
 
 
-def q_env_50(air_tightness_class):
+def q_env_50_default(air_tightness_class):
     """Table B.6 - Air permeability default values."""
     switcher = {"i": 2, "ii": 3, "iii": 6, "iv": 12, "1": 2, "2": 3, "3": 6, "4": 12}
     return switcher.get(str(air_tightness_class).lower())
@@ -405,30 +402,29 @@ def f_int_ext(building_element):
 
 def U_equiv_k(direction, z, B_prim, U_k, dU_TB):
     """Function E.1 - Equivalent U-value of the building part (k)
-    in contact with the ground."""
-    if z < 0:
-        print("Warning! - The z value is negative.")
-        z = 0
-        print("The z value was overwritten to z=0.")
-    if direction == "downwards":
-        a = 0.9671
-        b = -7.455
-        c = [10.76, 9.773, 0.0265]
-        d = -0.0203
-        n = [0.5532, 0.6027, -0.9296]
-    elif direction == "horizontal":
-        a = 0.93328
-        b = -2.1552
-        c = [0, 1.466]
-        d = 0.1006
-        n = [0, 0.45325, -1.0068]
-    x = b + (c[0] + B_prim) ** n[0] + (c[1] + z) ** n[1] + (c[2] + U_k + dU_TB) ** n[2]
-    return a / x + d
+    in contact with the ground, floors (downwards) and walls (horizontal).
+    Negative depths z are taken as 0."""
+    z = np.maximum(z, 0)
+    floor = np.asarray(direction) == "downwards"
+    # Table E.1, the B' term of walls is constant
+    a = np.where(floor, 0.9671, 0.93328)
+    b = np.where(floor, -7.455, -2.1552)
+    c = np.where(floor[..., None], [10.76, 9.773, 0.0265], [0, 1.466, 0])
+    d = np.where(floor, -0.0203, 0.1006)
+    n = np.where(floor[..., None], [0.5532, 0.6027, -0.9296], [0, 0.45325, -1.0068])
+    x = (
+        b
+        + (c[..., 0] + B_prim) ** n[..., 0]
+        + (c[..., 1] + z) ** n[..., 1]
+        + (c[..., 2] + U_k + dU_TB) ** n[..., 2]
+    )
+    return (a / x + d)[()]
 
 
 def B_prim(A_G, P):
-    """Function E.2 - Geometric parameter of the floor slab."""
-    if P == 0:
-        return 1
-    else:
-        return 2 * A_G / P
+    """Function E.2 - Geometric parameter of the floor slab, 1 without
+    an exposed perimeter."""
+    A_G, P = np.broadcast_arrays(np.asarray(A_G, dtype=float), P)
+    B = np.ones_like(A_G)
+    np.divide(2 * A_G, P, out=B, where=P != 0)
+    return B[()]
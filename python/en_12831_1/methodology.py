@@ -1,7 +1,29 @@
 from iso_6946.methodology import Construction, Transmittance
-import en_12831.functions as f
+import en_12831_1.functions as f
+import numpy as np
 from dataclasses import dataclass, field
+from numpy import iterable
 from typing import Any, List
+from utils.dependency import Node
+
+# Outside boundary conditions by code
+BOUNDARIES = (
+    "exterior",
+    "adjacent room",
+    "adjacent unheated room",
+    "adjacent building entity",
+    "ground",
+)
+
+
+def boundary_code(boundary):
+    """Integer codes of outside boundary conditions given by name or by code."""
+    boundary = np.asarray(boundary)
+    if boundary.dtype.kind in "iu":
+        return boundary
+    names, inverse = np.unique(boundary.astype(str), return_inverse=True)
+    codes = np.array([BOUNDARIES.index(name) for name in names], dtype=np.int8)
+    return codes[inverse].reshape(boundary.shape)
 
 
 @dataclass
@@ -28,7 +50,7 @@ class FloorSlab:
 
 
 @dataclass
-class BuildingElement:
+class BuildingElement(Node):
     name: str
     construction: Construction
     outside_boundary_condition: str
@@ -45,6 +67,7 @@ class BuildingElement:
             construction=self.construction,
             direction=self.surface.direction,
         )
+        self.depends_on(self.transmittance)
 
 
 """        if self.outside_boundary_condition in [
@@ -98,6 +121,7 @@ def H_T_ix(DesignDay, t_int_i, BuildingElement):
         U_equiv_k = f.U_equiv_k(direction, z=z, B_prim=B_prim, U_k=U_k, dU_TB=dU_TB)
 
         t_x = DesignDay.annual_mean_external_temperature
+        f_1 = f.f_1(t_int_i, t_x=t_x, t_e=t_e)
         f_2 = f.f_2(t_int_i, t_e, t_star_int_k)
         f_ig_k = f.f_ix_k(f_1, f_2)
         f_GW_k = f.f_GW(1.5)
@@ -107,14 +131,15 @@ def H_T_ix(DesignDay, t_int_i, BuildingElement):
 
 
 @dataclass
-class Room:
+class Room(Node):
     name: str
     area: float
     height: float
     volume: float
     building_elements: List[BuildingElement] or BuildingElement
+    design_day: DesignDay = None
+    t_int_i: float = 20.0  # Internal design temperature [*C]
 
-    t_int_i: float = field(init=False)
     t_e: float = field(init=False)
 
     H_T_ie: float = field(init=False)
@@ -130,8 +155,38 @@ class Room:
     Phi_HL_i: float = field(init=False)
 
     def __post_init__(self) -> None:
-        # self.H_T_ie = f.H_T_ie(self.A_k, self.U_k, self.dU_TB, self.f_U_k, self.f_ie_k)
-        """
+        elements = self.building_elements
+        if not iterable(elements):
+            elements = [elements]
+        self.depends_on(*elements)
+        # temperatures of adjacent rooms enter f_1 of their elements
+        self.depends_on(
+            *(
+                x.outside_boundary_condition_object
+                for x in elements
+                if isinstance(x.outside_boundary_condition_object, Node)
+            )
+        )
+        if self.design_day is None:
+            return
+
+        H = {
+            "exterior": 0.0,
+            "adjacent room": 0.0,
+            "adjacent unheated room": 0.0,
+            "adjacent building entity": 0.0,
+            "ground": 0.0,
+        }
+        for element in elements:
+            boundary, H_T_ix_k = H_T_ix(self.design_day, self.t_int_i, element)
+            H[boundary] += H_T_ix_k
+
+        self.t_e = self.design_day.external_design_temperature
+        self.H_T_ie = H["exterior"]
+        self.H_T_ia = H["adjacent room"]
+        self.H_T_iae = H["adjacent unheated room"]
+        self.H_T_iaBE = H["adjacent building entity"]
+        self.H_T_ig = H["ground"]
         self.Phi_T_i = f.Phi_T_i1(
             self.H_T_ie,
             self.H_T_ia,
@@ -140,7 +195,7 @@ class Room:
             self.H_T_ig,
             self.t_int_i,
             self.t_e,
-        )"""
+        )
 
 
 @dataclass
@@ -155,11 +210,16 @@ class Zone:
 
 
 @dataclass
-class Building:
+class Building(Node):
     name: str
+    rooms: List[Room] = field(default_factory=list)
 
     transmission_heat_loss: float = field(init=False)
     ventilation_heat_loss: float = field(init=False)
     heating_up_powers: float = field(init=False)
     heat_gains: float = field(init=False)
     design_heat_load: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.depends_on(*self.rooms)
+        self.transmission_heat_loss = sum(room.Phi_T_i for room in self.rooms)
@@ -0,0 +1,424 @@
+import en_12831_1.functions as f
+import numpy as np
+from dataclasses import dataclass, field
+from numpy.typing import ArrayLike
+from en_12831_1.methodology import BOUNDARIES, boundary_code
+from iso_6946.methodology import direction_code
+from numpy import iterable
+
+EXTERIOR, ADJACENT_ROOM, ADJACENT_UNHEATED_ROOM, ADJACENT_BUILDING_ENTITY, GROUND = (
+    range(len(BOUNDARIES))
+)
+
+
+def segment_sum(index, values, n):
+    """Sums of the values over their first axis by segment index,
+    an array of shape (n, ...)."""
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        return np.bincount(index, weights=values, minlength=n)
+    if len(values) == 0:
+        return np.zeros((n,) + values.shape[1:])
+    order = np.argsort(index, kind="stable")
+    counts = np.bincount(index, minlength=n)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    sums = np.add.reduceat(values[order], np.minimum(starts, len(order) - 1), axis=0)
+    # reduceat returns the value at the start for empty segments
+    sums[counts == 0] = 0
+    return sums
+
+
+def _room_elements(rooms):
+    """Room index of every element and the elements of the rooms."""
+    element_room, elements = [], []
+    for i, room in enumerate(rooms):
+        x = room.building_elements
+        x = list(x) if iterable(x) else [x]
+        element_room += [i] * len(x)
+        elements += x
+    return np.array(element_room, dtype=np.int64), elements
+
+
+def _element_arrays(elements):
+    """Inputs of ElementTransmission of BuildingElement objects."""
+    n = len(elements)
+    boundary = boundary_code([x.outside_boundary_condition for x in elements])
+    t_x = np.full(n, np.nan)
+    z, P = np.zeros(n), np.zeros(n)
+    for k, element in enumerate(elements):
+        other = element.outside_boundary_condition_object
+        if boundary[k] == GROUND:
+            z[k] = other.depth_below_ground_level
+            P[k] = other.exposed_perimeter
+        elif boundary[k] != EXTERIOR:
+            t_x[k] = other.t_int_i
+    return dict(
+        A_k=np.array([x.surface.area for x in elements], dtype=float),
+        U_k=np.array([x.transmittance.U for x in elements], dtype=float),
+        boundary=boundary,
+        t_x=t_x,
+        dU_TB=np.array(
+            [x.additional_thermal_transmittance for x in elements], dtype=float
+        ),
+        direction=direction_code([x.surface.direction for x in elements]),
+        z=z,
+        P=P,
+    )
+
+
+def _element_conductance(A_k, U_k, boundary, dU_TB, f_U_k, direction, z, P, h_GW):
+    """Heat transfer coefficients of functions 6-8 without the temperature
+    adjustment f_ix_k, with U_equiv_k and f_GW_k of the ground elements."""
+    A_k, U_k, dU_TB, f_U_k, direction, z, P, h_GW = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (A_k, U_k, dU_TB, f_U_k)),
+        direction_code(direction),
+        z,
+        P,
+        h_GW,
+    )
+    # Annex E only for the elements in contact with the ground
+    g = np.flatnonzero(boundary == GROUND)
+    U_equiv_k = np.full(A_k.shape, np.nan)
+    U_equiv_k[g] = f.U_equiv_k(
+        np.where(direction[g] == 2, "downwards", "horizontal"),
+        z=z[g],
+        B_prim=f.B_prim(A_G=A_k[g], P=P[g]),
+        U_k=U_k[g],
+        dU_TB=dU_TB[g],
+    )
+    f_GW_k = np.full(A_k.shape, np.nan)
+    f_GW_k[g] = f.f_GW(h_GW[g])
+
+    H_k = f.H_T_ia(A_k, U_k, f_ia_k=1.0)
+    e = np.flatnonzero(boundary == EXTERIOR)
+    H_k[e] = f.H_T_ie(A_k[e], U_k[e], dU_TB[e], f_U_k=f_U_k[e], f_ie_k=1.0)
+    H_k[g] = f.H_T_ig(A_k[g], U_equiv_k[g], 1.0, f_GW_k[g], f_tann=f.f_tann)
+    return H_k, U_equiv_k, f_GW_k
+
+
+@dataclass
+class ElementTransmission:
+    """Transmission heat transfer coefficients of many building elements
+    (functions 6-11 and E.1), every boundary group evaluated in one pass.
+    Element inputs are arrays over the elements or scalars; values that
+    do not apply to an element, e.g. U_equiv_k above ground, are NaN."""
+
+    A_k: ArrayLike  # Area of the elements [m2]
+    U_k: ArrayLike  # Thermal transmittance of the elements [W/m2K]
+    boundary: ArrayLike  # Outside boundary condition by name or code
+    t_e: ArrayLike  # External design temperature [*C]
+    t_int_i: ArrayLike = 20.0  # Internal design temperature of the room [*C]
+    t_x: ArrayLike = np.nan  # Temperature of the adjacent space [*C]
+    t_e_ann: ArrayLike = np.nan  # Annual mean external temperature [*C]
+    dU_TB: ArrayLike = 0.0  # Additional thermal transmittance of thermal bridges
+    f_U_k: ArrayLike = 1.0  # Correction factor for the influence of weather
+    t_star_int_k: ArrayLike = None  # Mean internal surface temperature, t_int_i if None
+    direction: ArrayLike = 2  # Heat flow direction of ground elements
+    z: ArrayLike = 0.0  # Depth of the ground element below ground level [m]
+    P: ArrayLike = 0.0  # Exposed perimeter of the floor slab [m]
+    h_GW: ArrayLike = 1.5  # Depth of the ground water table [m]
+
+    f_1: np.ndarray = field(init=False)
+    f_2: np.ndarray = field(init=False)
+    f_ix_k: np.ndarray = field(init=False)
+    U_equiv_k: np.ndarray = field(init=False)
+    f_GW_k: np.ndarray = field(init=False)
+    H_k: np.ndarray = field(init=False)  # Without temperature adjustment [W/K]
+    H_T_ix: np.ndarray = field(init=False)  # [W/K]
+
+    @classmethod
+    def from_elements(cls, elements, design_day, t_int_i=20.0):
+        """Transmission of BuildingElement objects, t_int_i of the room
+        of every element."""
+        return cls(
+            t_e=design_day.external_design_temperature,
+            t_int_i=t_int_i,
+            t_e_ann=design_day.annual_mean_external_temperature,
+            **_element_arrays(elements),
+        )
+
+    @property
+    def H_T_ie(self):
+        return np.where(self.boundary == EXTERIOR, self.H_T_ix, 0.0)
+
+    @property
+    def H_T_ia(self):
+        adjacent = (self.boundary != EXTERIOR) & (self.boundary != GROUND)
+        return np.where(adjacent, self.H_T_ix, 0.0)
+
+    @property
+    def H_T_ig(self):
+        return np.where(self.boundary == GROUND, self.H_T_ix, 0.0)
+
+    def __len__(self) -> int:
+        return len(self.H_T_ix)
+
+    def __post_init__(self) -> None:
+        self.boundary = boundary_code(self.boundary)
+        A_k, U_k, t_e, t_int_i, t_x, t_e_ann, dU_TB = np.broadcast_arrays(
+            *(
+                np.asarray(x, dtype=float)
+                for x in (
+                    self.A_k,
+                    self.U_k,
+                    self.t_e,
+                    self.t_int_i,
+                    self.t_x,
+                    self.t_e_ann,
+                    self.dU_TB,
+                )
+            ),
+            self.boundary,
+        )[:-1]
+        exterior = self.boundary == EXTERIOR
+        ground = self.boundary == GROUND
+        t_star_int_k = t_int_i if self.t_star_int_k is None else self.t_star_int_k
+
+        # the space beyond the exterior is at t_e and the ground at the annual mean
+        t_x = np.where(exterior, t_e, np.where(ground, t_e_ann, t_x))
+        self.f_1 = f.f_1(t_int_i, t_x=t_x, t_e=t_e)
+        self.f_2 = f.f_2(t_int_i, t_e=t_e, t_star_int_k=t_star_int_k)
+        self.f_ix_k = f.f_ix_k(self.f_1, self.f_2)
+
+        self.H_k, self.U_equiv_k, self.f_GW_k = _element_conductance(
+            A_k,
+            U_k,
+            self.boundary,
+            dU_TB,
+            self.f_U_k,
+            self.direction,
+            self.z,
+            self.P,
+            self.h_GW,
+        )
+        self.H_T_ix = self.H_k * self.f_ix_k
+
+
+@dataclass
+class BuildingModel:
+    """Building of elements, rooms and zones stored as index arrays. The
+    heat transfer coefficients of the elements are summed into the rooms
+    by boundary condition, the room heat loads into zones and the building."""
+
+    element_room: ArrayLike  # Room index of every element
+    element_boundary: ArrayLike  # Boundary condition of every element by name or code
+    H_T_ix: ArrayLike  # Transmission heat transfer coefficient of every element [W/K]
+    room_zone: ArrayLike  # Zone index of every room
+    t_e: float  # External design temperature [*C]
+    t_int_i: ArrayLike = 20.0  # Internal design temperature of the rooms [*C]
+    area: ArrayLike = 0.0  # Floor area of the rooms [m2]
+    Phi_V_i: ArrayLike = 0.0  # Ventilation heat loss of the rooms [W]
+    phi_hu_i: ArrayLike = 0.0  # Specific heating-up power of the rooms [W/m2]
+    Phi_gain_i: ArrayLike = 0.0  # Heat gains of the rooms, negative [W]
+    room_names: ArrayLike = None
+    zone_names: ArrayLike = None
+
+    H_T_i: np.ndarray = field(init=False)  # Rooms by boundary condition [W/K]
+    Phi_T_i: np.ndarray = field(init=False)
+    Phi_hu_i: np.ndarray = field(init=False)
+    Phi_HL_i: np.ndarray = field(init=False)
+    H_T_z: np.ndarray = field(init=False)  # Zones by boundary condition [W/K]
+    Phi_T_z: np.ndarray = field(init=False)
+    Phi_V_z: np.ndarray = field(init=False)
+    Phi_hu_z: np.ndarray = field(init=False)
+    Phi_HL_z: np.ndarray = field(init=False)
+    H_T_build: np.ndarray = field(init=False)  # Building by boundary condition [W/K]
+    Phi_T_build: float = field(init=False)
+    Phi_V_build: float = field(init=False)
+    Phi_hu_build: float = field(init=False)
+    Phi_HL_build: float = field(init=False)
+
+    @classmethod
+    def from_rooms(cls, rooms, design_day, room_zone=None, **kwargs):
+        """Model of Room objects, all in one zone unless room_zone is given."""
+        element_room, elements = _room_elements(rooms)
+        t_int_i = np.array([room.t_int_i for room in rooms], dtype=float)
+        transmission = ElementTransmission.from_elements(
+            elements, design_day, t_int_i[element_room]
+        )
+        return cls(
+            element_room=element_room,
+            element_boundary=transmission.boundary,
+            H_T_ix=transmission.H_T_ix,
+            room_zone=(
+                np.zeros(len(rooms), dtype=np.int64) if room_zone is None else room_zone
+            ),
+            t_e=design_day.external_design_temperature,
+            t_int_i=t_int_i,
+            area=np.array([room.area for room in rooms], dtype=float),
+            room_names=np.array([room.name for room in rooms]),
+            **kwargs,
+        )
+
+    @property
+    def n_rooms(self):
+        return len(self.room_zone)
+
+    @property
+    def n_zones(self):
+        if self.zone_names is not None:
+            return len(self.zone_names)
+        return int(self.room_zone.max()) + 1 if self.n_rooms else 0
+
+    def zone_sum(self, values):
+        """Sums of room values over the zones."""
+        return segment_sum(self.room_zone, values, self.n_zones)
+
+    def __post_init__(self) -> None:
+        self.element_room = np.asarray(self.element_room, dtype=np.int64)
+        self.element_boundary = boundary_code(self.element_boundary)
+        self.room_zone = np.asarray(self.room_zone, dtype=np.int64)
+        n = self.n_rooms
+        self.t_int_i, self.area, self.Phi_V_i, self.phi_hu_i, self.Phi_gain_i = (
+            np.broadcast_to(np.asarray(x, dtype=float), n)
+            for x in (
+                self.t_int_i,
+                self.area,
+                self.Phi_V_i,
+                self.phi_hu_i,
+                self.Phi_gain_i,
+            )
+        )
+
+        # one segment per room and boundary condition
+        segment = self.element_room * len(BOUNDARIES) + self.element_boundary
+        self.H_T_i = segment_sum(segment, self.H_T_ix, n * len(BOUNDARIES)).reshape(
+            n, len(BOUNDARIES)
+        )
+        self.Phi_T_i = f.Phi_T_ix(self.H_T_i.sum(axis=1), self.t_int_i, self.t_e)
+        self.Phi_hu_i = f.Phi_hu_i(self.area, self.phi_hu_i)
+        self.Phi_HL_i = f.Phi_HL_i(
+            self.Phi_T_i, self.Phi_V_i, self.Phi_hu_i
+        ) + np.asarray(self.Phi_gain_i)
+
+        self.H_T_z = self.zone_sum(self.H_T_i)
+        self.Phi_T_z = self.zone_sum(self.Phi_T_i)
+        self.Phi_V_z = self.zone_sum(self.Phi_V_i)
+        self.Phi_hu_z = self.zone_sum(self.Phi_hu_i)
+        self.Phi_HL_z = self.zone_sum(self.Phi_HL_i)
+
+        self.H_T_build = self.H_T_z.sum(axis=0)
+        self.Phi_T_build = self.Phi_T_z.sum()
+        self.Phi_V_build = self.Phi_V_z.sum()
+        self.Phi_hu_build = self.Phi_hu_z.sum()
+        self.Phi_HL_build = self.Phi_HL_z.sum()
+
+
+def climate_arrays(design_days):
+    """External design and annual mean external temperatures of DesignDays."""
+    t_e = np.array([x.external_design_temperature for x in design_days], dtype=float)
+    t_e_ann = np.array(
+        [x.annual_mean_external_temperature for x in design_days], dtype=float
+    )
+    return t_e, t_e_ann
+
+
+@dataclass
+class HeatLoadCoefficients:
+    """Temperature independent coefficients of the design heat loads of the
+    rooms of a building. Every element loses H_k (t_star_int_k - t_x), where
+    t_x is t_e beyond the exterior, the annual mean external temperature
+    below the ground and fixed otherwise. The load of every room is then
+    linear in the climate, C @ (1, t_e, t_e_ann), so any number of design
+    climates is evaluated as one matrix product."""
+
+    element_room: ArrayLike  # Room index of every element
+    A_k: ArrayLike  # Area of the elements [m2]
+    U_k: ArrayLike  # Thermal transmittance of the elements [W/m2K]
+    boundary: ArrayLike  # Outside boundary condition by name or code
+    t_int_i: ArrayLike  # Internal design temperature of the rooms [*C]
+    t_x: ArrayLike = np.nan  # Temperature of the adjacent space of the elements [*C]
+    dU_TB: ArrayLike = 0.0  # Additional thermal transmittance of thermal bridges
+    f_U_k: ArrayLike = 1.0  # Correction factor for the influence of weather
+    t_star_int_k: ArrayLike = None  # Mean internal surface temperature, t_int_i if None
+    direction: ArrayLike = 2  # Heat flow direction of ground elements
+    z: ArrayLike = 0.0  # Depth of the ground element below ground level [m]
+    P: ArrayLike = 0.0  # Exposed perimeter of the floor slab [m]
+    h_GW: ArrayLike = 1.5  # Depth of the ground water table [m]
+    H_V_i: ArrayLike = 0.0  # Ventilation heat transfer coefficient of the rooms [W/K]
+    Phi_hu_i: ArrayLike = 0.0  # Heating-up power of the rooms [W]
+    Phi_gain_i: ArrayLike = 0.0  # Heat gains of the rooms, negative [W]
+
+    H_k: np.ndarray = field(init=False)  # Without temperature adjustment [W/K]
+    C_T: np.ndarray = field(init=False)  # Transmission coefficients (rooms, 3)
+    C: np.ndarray = field(init=False)  # Heat load coefficients (rooms, 3)
+
+    @classmethod
+    def from_rooms(cls, rooms, **kwargs):
+        """Coefficients of Room objects and their elements."""
+        element_room, elements = _room_elements(rooms)
+        return cls(
+            element_room=element_room,
+            t_int_i=np.array([room.t_int_i for room in rooms], dtype=float),
+            **_element_arrays(elements),
+            **kwargs,
+        )
+
+    def transmission_losses(self, t_e, t_e_ann):
+        """Phi_T_i of every room for arrays of climates, (rooms, climates)."""
+        return self.C_T @ _climate(t_e, t_e_ann)
+
+    def design_loads(self, t_e, t_e_ann):
+        """Phi_HL_i of every room for arrays of climates, (rooms, climates)."""
+        return self.C @ _climate(t_e, t_e_ann)
+
+    def building_loads(self, t_e, t_e_ann):
+        """Design heat load of the building for arrays of climates."""
+        return self.C.sum(axis=0) @ _climate(t_e, t_e_ann)
+
+    def __post_init__(self) -> None:
+        self.element_room = np.asarray(self.element_room, dtype=np.int64)
+        self.boundary = boundary_code(self.boundary)
+        n = len(np.atleast_1d(self.t_int_i))
+        t_int_i, H_V_i, Phi_hu_i, Phi_gain_i = (
+            np.broadcast_to(np.asarray(x, dtype=float), n)
+            for x in (self.t_int_i, self.H_V_i, self.Phi_hu_i, self.Phi_gain_i)
+        )
+        self.H_k = _element_conductance(
+            self.A_k,
+            self.U_k,
+            self.boundary,
+            self.dU_TB,
+            self.f_U_k,
+            self.direction,
+            self.z,
+            self.P,
+            self.h_GW,
+        )[0]
+        t_star_int_k = (
+            t_int_i[self.element_room]
+            if self.t_star_int_k is None
+            else self.t_star_int_k
+        )
+        t_star_int_k, t_x = np.broadcast_arrays(
+            np.asarray(t_star_int_k, dtype=float),
+            np.asarray(self.t_x, dtype=float),
+        )
+
+        # coefficients of 1, t_e and t_e_ann of every element
+        exterior = self.boundary == EXTERIOR
+        ground = self.boundary == GROUND
+        adjacent = ~(exterior | ground)
+        element = np.stack(
+            [
+                self.H_k * (t_star_int_k - np.where(adjacent, t_x, 0.0)),
+                np.where(exterior, -self.H_k, 0.0),
+                np.where(ground, -self.H_k, 0.0),
+            ],
+            axis=-1,
+        )
+        self.C_T = segment_sum(self.element_room, element, n)
+
+        # ventilation H_V_i (t_int_i - t_e), heating-up and gains
+        room = np.stack(
+            [H_V_i * t_int_i + Phi_hu_i + Phi_gain_i, -H_V_i, np.zeros(n)], axis=-1
+        )
+        self.C = self.C_T + room
+
+
+def _climate(t_e, t_e_ann):
+    """Rows 1, t_e and t_e_ann of climates."""
+    t_e, t_e_ann = np.broadcast_arrays(
+        np.asarray(t_e, dtype=float), np.asarray(t_e_ann, dtype=float)
+    )
+    return np.stack([np.ones_like(t_e), t_e, t_e_ann])
@@ -0,0 +1,144 @@
+import en_12831_1.functions as f
+import numpy as np
+from dataclasses import dataclass, field
+from numpy.typing import ArrayLike
+from numpy import iterable
+from en_12831_1.model import ElementTransmission
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import spsolve
+
+# Connections to these nodes link a space to the outside
+EXTERIOR_NODE = -1
+GROUND_NODE = -2
+
+
+@dataclass
+class ThermalNetwork:
+    """Steady state heat balance of the spaces of a building, solving the
+    temperatures of all unheated spaces at once. Spaces are linked by
+    connections with the heat transfer coefficients of functions 42-44;
+    node_b may be EXTERIOR_NODE or GROUND_NODE instead of a space."""
+
+    node_a: ArrayLike  # First space of every connection
+    node_b: ArrayLike  # Second space or outside node of every connection
+    H_T_12: ArrayLike  # Transmission heat transfer coefficient [W/K]
+    t_int: ArrayLike  # Temperature of the spaces, NaN for unheated spaces [*C]
+    t_e: float  # External design temperature [*C]
+    t_ground: float = None  # Temperature of the ground, t_e if None [*C]
+    q_V_12: ArrayLike = 0.0  # Air volume flow between the spaces [m3/h]
+    rho: float = 1.2  # Density of air [kg/m3]
+    c_p: float = 1005 / 3600  # Specific heat capacity of air [Wh/kgK]
+    Phi_gain: ArrayLike = 0.0  # Heat gains of the spaces [W]
+    spaces: list = field(default=None, repr=False)  # Room objects of the nodes
+
+    H_12: np.ndarray = field(init=False)  # Heat transfer coefficient [W/K]
+    t: np.ndarray = field(init=False)  # Temperature of all spaces [*C]
+    Phi_12: np.ndarray = field(init=False)  # Heat flow from a to b [W]
+
+    @classmethod
+    def from_rooms(cls, rooms, design_day, unheated=(), **kwargs):
+        """Network of Room objects through the transmission of their
+        elements. Spaces behind adjacent elements join the network, the
+        unheated ones are solved and the others keep their t_int_i.
+        An element listed by both of its spaces counts once. Ground
+        elements link to the ground at the annual mean temperature with
+        H_T_ig of function 8 without f_ig_k."""
+        spaces = list(rooms)
+        index = {id(space): i for i, space in enumerate(spaces)}
+        seen = set()
+        node_a, node_b, connections = [], [], []
+        i = 0
+        while i < len(spaces):
+            elements = getattr(spaces[i], "building_elements", [])
+            for element in elements if iterable(elements) else [elements]:
+                if id(element) in seen:
+                    continue
+                seen.add(id(element))
+                boundary = element.outside_boundary_condition
+                if boundary == "exterior":
+                    j = EXTERIOR_NODE
+                elif boundary == "ground":
+                    j = GROUND_NODE
+                else:
+                    other = element.outside_boundary_condition_object
+                    if id(other) not in index:
+                        index[id(other)] = len(spaces)
+                        spaces.append(other)
+                    j = index[id(other)]
+                node_a.append(i)
+                node_b.append(j)
+                connections.append(element)
+            i += 1
+
+        # functions 6-8 of every element without the temperature adjustment,
+        # summed per pair of spaces when solving
+        if connections:
+            H_T_12 = ElementTransmission.from_elements(connections, design_day).H_k
+        else:
+            H_T_12 = np.empty(0)
+
+        unknown = {id(space) for space in unheated}
+        return cls(
+            node_a=np.array(node_a, dtype=np.int64),
+            node_b=np.array(node_b, dtype=np.int64),
+            H_T_12=H_T_12,
+            t_int=np.array(
+                [np.nan if id(x) in unknown else x.t_int_i for x in spaces],
+                dtype=float,
+            ),
+            t_e=design_day.external_design_temperature,
+            t_ground=design_day.annual_mean_external_temperature,
+            spaces=spaces,
+            **kwargs,
+        )
+
+    def apply(self):
+        """Set t_int_i of the unheated spaces of from_rooms to the solution,
+        the rooms adjacent to them recompute on their next access."""
+        if self.spaces is None:
+            raise ValueError(
+                "No spaces to apply to, build the network with from_rooms."
+            )
+        for space, unheated, t in zip(self.spaces, self.unheated, self.t.tolist()):
+            if unheated:
+                space.t_int_i = t
+
+    def __post_init__(self) -> None:
+        node_a = np.asarray(self.node_a, dtype=np.int64)
+        node_b = np.asarray(self.node_b, dtype=np.int64)
+        t_int = np.asarray(self.t_int, dtype=float)
+        n = len(t_int)
+        t_ground = self.t_e if self.t_ground is None else self.t_ground
+
+        H_V_12 = f.H_V_12(np.asarray(self.q_V_12, dtype=float), self.rho, self.c_p)
+        self.H_12 = np.broadcast_to(f.H_12(self.H_T_12, H_V_12), node_a.shape)
+
+        # outside nodes follow the spaces, all temperatures of the network
+        node_b = np.where(node_b == EXTERIOR_NODE, n, node_b)
+        node_b = np.where(node_b == GROUND_NODE, n + 1, node_b)
+        t = np.concatenate([t_int, [self.t_e, t_ground]])
+        self.unheated = np.isnan(t_int)
+
+        # conductance matrix, duplicate connections add up
+        rows = np.concatenate([node_a, node_b, node_a, node_b])
+        cols = np.concatenate([node_a, node_b, node_b, node_a])
+        H = np.concatenate([self.H_12, self.H_12, -self.H_12, -self.H_12])
+        G = coo_matrix((H, (rows, cols)), shape=(n + 2, n + 2)).tocsr()
+
+        # balance of the unheated spaces, G_uu t_u = Phi_gain_u - G_uk t_k
+        u = np.flatnonzero(self.unheated)
+        k = np.flatnonzero(~np.isnan(t))
+        if len(u):
+            Phi_gain = np.broadcast_to(np.asarray(self.Phi_gain, dtype=float), n)
+            b = Phi_gain[u] - G[u][:, k] @ t[k]
+            G_uu = G[u][:, u].tocsc()
+            if np.any(G_uu.diagonal() <= 0):
+                raise ValueError("Unheated spaces without connections.")
+            t[u] = np.atleast_1d(spsolve(G_uu, b))
+            if np.any(~np.isfinite(t[u])):
+                raise ValueError(
+                    "Unheated spaces not connected to a space of known temperature."
+                )
+
+        self.t = t[:n]
+        self.Phi_12 = self.H_12 * (t[node_a] - t[node_b])
@@ -0,0 +1,186 @@
+import en_12831_1.functions as f
+import numpy as np
+from dataclasses import dataclass, field
+from numpy.typing import ArrayLike
+from en_12831_1.model import segment_sum
+
+
+@dataclass
+class ZoneVentilation:
+    """Ventilation heat losses (functions 17-38) of all rooms of the
+    ventilation zones of a building. The external air entering a zone
+    through leakages and ATDs is allocated to its rooms by envelope area
+    and ATD design flow. Room inputs are arrays over the rooms, zone inputs
+    arrays over the zones, any of them may be scalars. Air volume flows
+    are in m3/h."""
+
+    room_zone: ArrayLike  # Zone index of every room
+    t_e: float  # External design temperature [*C]
+    q_env_50: ArrayLike  # Air permeability at 50 Pa of the zones [m3/h*m2]
+    t_star_int_i: ArrayLike = 20.0  # Internal air temperature of the rooms [*C]
+    V_i: ArrayLike = 0.0  # Volume of the rooms [m3]
+    n_min_i: ArrayLike = 0.5  # Minimum air change rate of the rooms [1/h]
+    A_env_i: ArrayLike = 0.0  # Envelope area of the rooms [m2]
+    q_v_ATD_design_i: ArrayLike = 0.0  # Design flow of the ATDs of the rooms
+    q_v_open_i: ArrayLike = 0.0  # External air flow through large openings
+    q_v_sup_i: ArrayLike = 0.0  # Mechanical supply air flow
+    q_v_exh_i: ArrayLike = 0.0  # Mechanical exhaust air flow
+    q_v_comb_i: ArrayLike = 0.0  # Combustion air flow
+    q_v_transfer_ij: ArrayLike = 0.0  # Transfer air flow from other rooms
+    t_transfer_ij: ArrayLike = None  # Transfer air temperature, t_star_int_i if None
+    f_dir: ArrayLike = 2.0  # Directional factor of the room air flow
+    eta_rec_z: ArrayLike = 0.0  # Efficiency of the heat recovery of the zones
+    f_fac_z: ArrayLike = 8.0  # Adjustment factor of the unbalanced flow of the zones
+    f_qv_z: ArrayLike = 0.05  # Ratio of the additional infiltration of the zones
+    dp_ATD_design_z: ArrayLike = f.dp_ATD_design_z  # Design pressure of the ATDs [Pa]
+    v_leak_z: ArrayLike = f.v_leak_z  # Pressure exponent of the leakages
+    rho: float = 1.2  # Density of air [kg/m3]
+    c_p: float = 1005 / 3600  # Specific heat capacity of air [Wh/kgK]
+    n_zones: int = None
+
+    # zones
+    A_env_z: np.ndarray = field(init=False)
+    q_v_ATD_50_z: np.ndarray = field(init=False)
+    f_e_z: np.ndarray = field(init=False)
+    q_v_inf_add_z: np.ndarray = field(init=False)
+    q_v_env_z: np.ndarray = field(init=False)
+    a_ATD_z: np.ndarray = field(init=False)
+    t_exh_z: np.ndarray = field(init=False)
+    t_rec_z: np.ndarray = field(init=False)
+    Phi_V_z: np.ndarray = field(init=False)
+
+    # rooms
+    q_v_leak_ATD_i: np.ndarray = field(init=False)
+    q_v_env_i: np.ndarray = field(init=False)
+    q_v_techn_i: np.ndarray = field(init=False)
+    q_v_min_i: np.ndarray = field(init=False)
+    Phi_V_i: np.ndarray = field(init=False)  # Ventilation heat loss of the rooms [W]
+    Phi_V_build: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        z = self.room_zone = np.asarray(self.room_zone, dtype=np.int64)
+        n = len(z)
+        if self.n_zones is None:
+            self.n_zones = int(z.max()) + 1 if n else 0
+        m = self.n_zones
+
+        def rooms(x):
+            return np.broadcast_to(np.asarray(x, dtype=float), n)
+
+        def zones(x):
+            return np.broadcast_to(np.asarray(x, dtype=float), m)
+
+        t_star_int_i, V_i, n_min_i, A_env_i, q_ATD_i = map(
+            rooms,
+            (
+                self.t_star_int_i,
+                self.V_i,
+                self.n_min_i,
+                self.A_env_i,
+                self.q_v_ATD_design_i,
+            ),
+        )
+        q_open, q_sup, q_exh, q_comb, q_transfer, f_dir = map(
+            rooms,
+            (
+                self.q_v_open_i,
+                self.q_v_sup_i,
+                self.q_v_exh_i,
+                self.q_v_comb_i,
+                self.q_v_transfer_ij,
+                self.f_dir,
+            ),
+        )
+        t_transfer = (
+            t_star_int_i if self.t_transfer_ij is None else rooms(self.t_transfer_ij)
+        )
+        q_env_50, eta_rec_z, f_fac_z, f_qv_z = map(
+            zones, (self.q_env_50, self.eta_rec_z, self.f_fac_z, self.f_qv_z)
+        )
+
+        # functions 25-27 and 35, sums over the rooms of the zones
+        q_v_sup_z, q_v_exh_z, q_v_comb_z = (
+            segment_sum(z, x, m) for x in (q_sup, q_exh, q_comb)
+        )
+        self.A_env_z = segment_sum(z, A_env_i, m)
+        q_ATD_z = segment_sum(z, q_ATD_i, m)
+
+        # functions 20-22, 24 and 28-30 of the zones
+        self.q_v_ATD_50_z = f.q_v_ATD_50_z(q_ATD_z, self.dp_ATD_design_z, self.v_leak_z)
+        q_50 = q_env_50 * self.A_env_z + self.q_v_ATD_50_z
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f_e_z = f.f_e_z(
+                f_fac_z,
+                f_qv_z,
+                q_v_exh_z,
+                q_v_comb_z,
+                q_v_sup_z,
+                q_env_50,
+                self.A_env_z,
+                self.q_v_ATD_50_z,
+            )
+        # zones without leakages or ATDs have no additional infiltration
+        self.f_e_z = np.where(q_50 > 0, f_e_z, 1.0)
+        self.q_v_inf_add_z = f.q_v_inf_add_z(
+            q_env_50, self.A_env_z, self.q_v_ATD_50_z, f_qv_z, self.f_e_z
+        )
+        self.q_v_env_z = f.q_v_env_z(
+            q_v_exh_z, q_v_comb_z, q_v_sup_z, self.q_v_inf_add_z
+        )
+        # function 22
+        self.a_ATD_z = _ratio(self.q_v_ATD_50_z, q_50)
+        q_v_leak_z = f.q_v_leak_z(self.a_ATD_z, self.q_v_env_z)
+        q_v_ATD_z = f.q_v_ATD_z(self.a_ATD_z, self.q_v_env_z)
+
+        # function 19, leakages by envelope area and ATDs by design flow
+        self.q_v_leak_ATD_i = q_v_leak_z[z] * _ratio(
+            A_env_i, self.A_env_z[z]
+        ) + q_v_ATD_z[z] * _ratio(q_ATD_i, q_ATD_z[z])
+
+        # function 18, zones without external air give none to their rooms
+        q_v_env_z, q_v_inf_add_z = self.q_v_env_z[z], self.q_v_inf_add_z[z]
+        safe = np.where(q_v_env_z > 0, q_v_env_z, 1.0)
+        self.q_v_env_i = np.where(
+            q_v_env_z > 0,
+            f.q_v_env_i(q_v_inf_add_z, safe, self.q_v_leak_ATD_i, f_dir),
+            0.0,
+        )
+
+        # functions 37 and 38, zones without exhaust use the mean room temperature
+        q_exh_t = segment_sum(z, q_exh * t_star_int_i, m)
+        t_mean = _ratio(segment_sum(z, t_star_int_i, m), np.bincount(z, minlength=m))
+        self.t_exh_z = np.where(q_v_exh_z > 0, _ratio(q_exh_t, q_v_exh_z), t_mean)
+        self.t_rec_z = f.t_rec_z(self.t_e, eta_rec_z, self.t_exh_z)
+
+        # functions 17, 23 and 33 of the rooms
+        self.q_v_techn_i = f.q_v_techn_i(q_sup, q_transfer, q_exh, q_comb)
+        self.q_v_min_i = f.q_v_min_i(n_min_i, V_i)
+        self.Phi_V_i = f.Phi_V_i2(
+            self.rho,
+            self.c_p,
+            self.q_v_env_i,
+            q_open,
+            self.q_v_min_i,
+            self.q_v_techn_i,
+            t_star_int_i,
+            self.t_e,
+            q_sup,
+            self.t_rec_z[z],
+            q_transfer,
+            t_transfer,
+        )
+        self.Phi_V_z = segment_sum(z, self.Phi_V_i, m)
+        self.Phi_V_build = self.Phi_V_z.sum()
+
+
+def _ratio(numerator, denominator):
+    """Elementwise ratio, 0 where the denominator is 0."""
+    numerator, denominator = np.broadcast_arrays(
+        np.asarray(numerator, dtype=float), np.asarray(denominator, dtype=float)
+    )
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator),
+        where=denominator != 0,
+    )
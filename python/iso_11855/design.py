@@ -0,0 +1,109 @@
+import iso_11855.functions as f
+import numpy as np
+from iso_11855.methodology import EmbeddedPipe, EmbeddedRadiantSystemBatch
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import product, repeat
+
+
+@dataclass(frozen=True)
+class Room:
+    name: str
+    q_des: float  # Design heat flux [W/m2]
+    t_i: float = 20.0  # Design indoor temperature [*C]
+    R_k_B: float = 0.1  # Thermal resistance of the floor covering [m2K/W]
+    t_F_max: float = 29.0  # Maximum surface temperature [*C]
+
+
+@dataclass(frozen=True)
+class DesignSpace:
+    system_types: tuple = ("A", "B", "D")
+    W: tuple = (0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45)  # [m]
+    s_u: tuple = (0.03, 0.045, 0.065)  # Thickness of layer above the pipe [m]
+    t_V: tuple = tuple(range(25, 56))  # Supply temperatures [*C]
+    sigma: float = 5.0  # Temperature drop of the heating medium t_V - t_R [K]
+    embedded_pipe: EmbeddedPipe = field(default_factory=EmbeddedPipe)
+    case_of_application: str = "floor heating"
+    k_E: float = 1.8  # Thermal conductivity of screed [W/mK]
+    psi: float = 0.05  # Volume ratio of the fixing inserts in the screed
+    method: str = "cubic"
+
+
+@dataclass
+class RoomDesign:
+    room: Room
+    feasible: bool
+    system_type: str = None
+    W: float = np.nan  # Pipe spacing [m]
+    s_u: float = np.nan  # Thickness of layer above the pipe [m]
+    t_V: float = np.nan  # Supply temperature [*C]
+    t_R: float = np.nan  # Return temperature [*C]
+    q: float = np.nan  # Heat flux [W/m2]
+    q_G: float = np.nan  # Limit heat flux [W/m2]
+
+
+@lru_cache(maxsize=64)
+def design_grid(space, t_i, R_k_B, t_F_max):
+    """All layouts of the design space evaluated for one floor covering."""
+    system_type, W, s_u = (
+        np.array(x) for x in zip(*product(space.system_types, space.W, space.s_u))
+    )
+    return EmbeddedRadiantSystemBatch(
+        system_type=system_type,
+        embedded_pipe=space.embedded_pipe,
+        case_of_application=space.case_of_application,
+        W=W,
+        s_u=s_u,
+        R_k_B=R_k_B,
+        k_E=space.k_E,
+        psi=space.psi,
+        t_i=t_i,
+        t_F_max=t_F_max,
+        method=space.method,
+    )
+
+
+def optimize_room(room, space=DesignSpace()):
+    """Layout with the lowest supply temperature covering q_des of the room
+    without exceeding the limit curve. On a tie the larger pipe spacing
+    and then the thinner screed is preferred."""
+    systems = design_grid(space, room.t_i, room.R_k_B, room.t_F_max)
+    t_V = np.sort(np.array(space.t_V, dtype=float))
+
+    # first supply temperature of the list at or above the one reaching q_des
+    k = np.searchsorted(t_V, systems.supply_temperature(room.q_des, space.sigma))
+
+    # layouts whose limit heat flux is below q_des fail for any supply temperature
+    i = np.flatnonzero((systems.q_G >= room.q_des) & (k < len(t_V)))
+    k = k[i]
+    deltat_H = f.deltat_H(t_V[k], t_V[k] - space.sigma, room.t_i)
+    below_limit = deltat_H <= systems.deltat_H_G[i]
+    i, k, deltat_H = i[below_limit], k[below_limit], deltat_H[below_limit]
+    if len(i) == 0:
+        return RoomDesign(room=room, feasible=False)
+
+    best = np.lexsort((systems.s_u[i], -systems.W[i], t_V[k]))[0]
+    j, k, deltat_H = i[best], k[best], deltat_H[best]
+    return RoomDesign(
+        room=room,
+        feasible=True,
+        system_type=str(systems.system_type[j]),
+        W=float(systems.W[j]),
+        s_u=float(systems.s_u[j]),
+        t_V=float(t_V[k]),
+        t_R=float(t_V[k] - space.sigma),
+        q=float(systems.K_H[j] * deltat_H),
+        q_G=float(systems.q_G[j]),
+    )
+
+
+def optimize_rooms(rooms, space=DesignSpace(), processes=None, chunksize=16):
+    """Optimize every room, fanning the rooms out across a process pool.
+    With processes=1 the rooms are optimized in the current process."""
+    if processes == 1:
+        return [optimize_room(room, space) for room in rooms]
+    with ProcessPoolExecutor(processes) as executor:
+        return list(
+            executor.map(optimize_room, rooms, repeat(space), chunksize=chunksize)
+        )
@@ -1,6 +1,8 @@
-from math import exp, log, sqrt, prod, e, pi
+from math import prod, e, pi
 import numpy as np
-from scipy.interpolate import CubicSpline, interp2d, interpn
+from scipy.interpolate import CubicSpline
+from utils.interpolation import GridInterpolator
+from utils.tables import tables
 
 
 def q1(t_S_m, t_i):
@@ -43,7 +45,15 @@ def q_des(h_t, t_S_m, t_i):
 def deltat_H(t_V, t_R, t_i):
     """Function A.1 - Temperature difference
     between heating fluid and room."""
-    return (t_V - t_R) / log((t_V - t_i) / (t_R - t_i))
+    return (t_V - t_R) / np.log((t_V - t_i) / (t_R - t_i))
+
+
+def t_V(deltat_H, sigma, t_i):
+    """Function A.1 solved for the supply temperature
+    with the temperature drop sigma = t_V - t_R."""
+    x = sigma / deltat_H
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return t_i + np.where(x > 0, sigma / -np.expm1(-x), deltat_H)[()]
 
 
 # Function A.2 = Function 5
@@ -102,7 +112,9 @@ def q9(a_B, a_W, a_U, a_WL, a_K, m_W, deltat_H, B=6.5):
 
 def a_B2(a_U, a_W, m_W, a_WL, a_K, R_k_B, W, B=6.5):
     """Function A.12 - Surface covering factor for system type B."""
-    return 1 / (1 + B * a_U * a_W**m_W * a_WL * a_K * R_k_B * (1 + 0.44 * sqrt(W)))
+    return 1 / (
+        1 + B * a_U * a_W**m_W * a_WL * a_K * R_k_B * (1 + 0.44 * np.sqrt(W))
+    )
 
 
 def a_U2(alfa, s_u, k_E):
@@ -175,11 +187,9 @@ def deltat_H_G(t_H_G_0375, f_G):
 
 def f_G(s_u, W, q_G_max, q_G_0375):
     """Function A.24 -"""
-    if s_u / W > 0.173:
-        x = q_G_0375 * 0.375 / W
-        return (q_G_max - (q_G_max - x) * e ** (-20 * (s_u / W - 0.173) ** 2)) / x
-    else:
-        return 1
+    x = q_G_0375 * 0.375 / W
+    f = (q_G_max - (q_G_max - x) * e ** (-20 * (s_u / W - 0.173) ** 2)) / x
+    return np.where(s_u / W > 0.173, f, 1)[()]
 
 
 def q_G3(a_WL, a_WL_W, q_G_W):
@@ -199,8 +209,8 @@ def B1(B_0, a_i, m_i, W, k_R, d_a, s_R):
     k_R_0 = 0.35
     s_R_0 = 0.002
     x = 1 / B_0 + 1.1 / pi * power_product(a_i, m_i) * W * (
-        1 / (2 * k_R) * log(d_a / (d_a - 2 * s_R))
-        - 1 / (2 * k_R_0) * log(d_a / (d_a - 2 * s_R_0))
+        1 / (2 * k_R) * np.log(d_a / (d_a - 2 * s_R))
+        - 1 / (2 * k_R_0) * np.log(d_a / (d_a - 2 * s_R_0))
     )
     return 1 / x
 
@@ -219,9 +229,9 @@ def B2(B_0, a_i, m_i, W, k_R, d_a, s_R, k_M, d_M):
     k_R_0 = 0.35
     s_R_0 = 0.002
     x = 1 / B_0 + 1.1 / pi * power_product(a_i, m_i) * W * (
-        1 / (2 * k_M) * log(d_M / d_a)
-        + 1 / (2 * k_R) * log(d_a / (d_a - 2 * s_R))
-        - 1 / (2 * k_R_0) * log(d_M / (d_M - 2 * s_R_0))
+        1 / (2 * k_M) * np.log(d_M / d_a)
+        + 1 / (2 * k_R) * np.log(d_a / (d_a - 2 * s_R))
+        - 1 / (2 * k_R_0) * np.log(d_M / (d_M - 2 * s_R_0))
     )
     return 1 / x
 
@@ -268,8 +278,8 @@ def deltaR_h(alfa):
     return 1 / alfa - 1 / 10.8
 
 
-def a_W1(R_k_B):
-    """Table A.2 - Pipe spacing factor for system types A, C, H, I, J."""
+@tables.register("iso_11855.a_W1")
+def _a_W1_table():
     x_R_k_B = [0.0, 0.05, 0.1, 0.15]
     y_a_W = [1.23, 1.188, 1.156, 1.134]
     cs = CubicSpline(x_R_k_B, y_a_W)
@@ -283,12 +293,16 @@ def a_W1(R_k_B):
     ax.legend(loc='lower left', ncol=2)
     plt.show()
     """
-    return cs(R_k_B)
+    return cs
 
 
-def a_U1(R_k_B, W):
-    """Table A.3 - Covering factor for system types A, C, H, I, J."""
+def a_W1(R_k_B):
+    """Table A.2 - Pipe spacing factor for system types A, C, H, I, J."""
+    return tables.get("iso_11855.a_W1")(R_k_B)
+
 
+@tables.register("iso_11855.a_U1")
+def _a_U1_table():
     x_R_k_B = [0.0, 0.05, 0.1, 0.15]
     y_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375]
     z_a_U = [
@@ -301,13 +315,16 @@ def a_U1(R_k_B, W):
         [1.0395, 1.031, 1.024, 1.021],
         [1.03, 1.0221, 1.0181, 1.015],
     ]
-    cs = interp2d(x_R_k_B, y_W, z_a_U, kind="cubic")
-    return float(cs(R_k_B, W))
+    return GridInterpolator((y_W, x_R_k_B), z_a_U)
 
 
-def a_D(R_k_B, W):
-    """Table A.4 - Pipe external diameter factor for system types A, C, H, I, J."""
+def a_U1(R_k_B, W, method="cubic"):
+    """Table A.3 - Covering factor for system types A, C, H, I, J."""
+    return tables.get("iso_11855.a_U1")(W, R_k_B, method=method)
 
+
+@tables.register("iso_11855.a_D")
+def _a_D_table():
     x_R_k_B = [0.0, 0.05, 0.1, 0.15]
     y_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375]
     z_a_D = [
@@ -320,13 +337,16 @@ def a_D(R_k_B, W):
         [1.053, 1.049, 1.044, 1.039],
         [1.056, 1.051, 1.046, 1.042],
     ]
-    cs = interp2d(x_R_k_B, y_W, z_a_D, kind="cubic")
-    return float(cs(R_k_B, W))
+    return GridInterpolator((y_W, x_R_k_B), z_a_D)
 
 
-def B_G1(s_u, k_E, W):
-    """Table A.5 - Coefficient for s_u/k <= 0.792 for system types A, C, H, I, J."""
+def a_D(R_k_B, W, method="cubic"):
+    """Table A.4 - Pipe external diameter factor for system types A, C, H, I, J."""
+    return tables.get("iso_11855.a_D")(W, R_k_B, method=method)
+
 
+@tables.register("iso_11855.B_G1")
+def _B_G1_table():
     x_s_u_k_E = [0.01, 0.0208, 0.0292, 0.0375, 0.0458, 0.0542, 0.0625, 0.0708, 0.0792]
     y_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375]
     z_B_G = [
@@ -339,25 +359,29 @@ def B_G1(s_u, k_E, W):
         [20.5, 26.8, 31.6, 36.4, 51.5, 47.5, 57.5, 65.3, 72.4],
         [11.5, 13.7, 15.5, 18.2, 21.5, 27.5, 40.0, 49.1, 58.3],
     ]
-    cs = interp2d(x_s_u_k_E, y_W, z_B_G, kind="cubic")
-    return float(cs(s_u / k_E, W))
+    return GridInterpolator((y_W, x_s_u_k_E), z_B_G)
+
+
+def B_G1(s_u, k_E, W, method="cubic"):
+    """Table A.5 - Coefficient for s_u/k <= 0.792 for system types A, C, H, I, J."""
+    return tables.get("iso_11855.B_G1")(W, s_u / k_E, method=method)
+
+
+@tables.register("iso_11855.B_G2")
+def _B_G2_table():
+    x_s_u_W = [0.173, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7]
+    y_B_G = [27.5, 40, 57.5, 69.5, 78.2, 84.5, 88.3, 91.6, 94, 96.3, 98.6, 99.8]
+    return CubicSpline(x_s_u_W, y_B_G)
 
 
 def B_G2(s_u, W):
     """Table A.6 - Coefficient for s_u/k > 0.792 for system types A, C, H, I, J."""
     x = s_u / W
-    if x <= 0.7:
-        x_s_u_W = [0.173, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7]
-        y_B_G = [27.5, 40, 57.5, 69.5, 78.2, 84.5, 88.3, 91.6, 94, 96.3, 98.6, 99.8]
-        cs = CubicSpline(x_s_u_W, y_B_G)
-        return cs(x)
-    else:
-        return 100.0
-
+    return np.where(x <= 0.7, tables.get("iso_11855.B_G2")(x), 100.0)[()]
 
-def n_G1(s_u, k_E, W):
-    """Table A.7 - Exponent for s_u/k <= 0.792 for system types A, C, H, I, J."""
 
+@tables.register("iso_11855.n_G1")
+def _n_G1_table():
     x_s_u_k_E = [0.01, 0.0208, 0.0292, 0.0375, 0.0458, 0.0542, 0.0625, 0.0708, 0.0792]
     y_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.2625, 0.3, 0.3375, 0.375]
     z_n_G = [
@@ -372,58 +396,67 @@ def n_G1(s_u, k_E, W):
         [0.322, 0.321, 0.321, 0.310, 0.293, 0.260, 0.187, 0.148, 0.115],
         [0.422, 0.421, 0.421, 0.405, 0.385, 0.325, 0.230, 0.183, 0.142],
     ]
-    cs = interp2d(x_s_u_k_E, y_W, z_n_G, kind="cubic")
-    return float(cs(s_u / k_E, W))
+    return GridInterpolator((y_W, x_s_u_k_E), z_n_G)
+
+
+def n_G1(s_u, k_E, W, method="cubic"):
+    """Table A.7 - Exponent for s_u/k <= 0.792 for system types A, C, H, I, J."""
+    return tables.get("iso_11855.n_G1")(W, s_u / k_E, method=method)
+
+
+@tables.register("iso_11855.n_G2")
+def _n_G2_table():
+    x_s_u_W = [0.173, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7]
+    y_n_G = [
+        0.32,
+        0.23,
+        0.145,
+        0.097,
+        0.067,
+        0.048,
+        0.033,
+        0.023,
+        0.015,
+        0.009,
+        0.005,
+        0.002,
+    ]
+    return CubicSpline(x_s_u_W, y_n_G)
 
 
 def n_G2(s_u, W):
     """Table A.8 - Exponent for s_u/k > 0.792 for system types A, C, H, I, J."""
     x = s_u / W
-    if x <= 0.7:
-        x_s_u_W = [0.173, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7]
-        y_n_G = [
-            0.32,
-            0.23,
-            0.145,
-            0.097,
-            0.067,
-            0.048,
-            0.033,
-            0.023,
-            0.015,
-            0.009,
-            0.005,
-            0.002,
-        ]
-        cs = CubicSpline(x_s_u_W, y_n_G)
-        return cs(x)
-    else:
-        return 0.0
+    return np.where(x <= 0.7, tables.get("iso_11855.n_G2")(x), 0.0)[()]
 
 
-def a_W2(s_u, k_E):
-    """Table A.9 - Pipe spacing factor for system type B."""
+@tables.register("iso_11855.a_W2")
+def _a_W2_table():
     x_s_u_k_E = [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.08, 0.1, 0.15, 0.18]
     y_a_W = [1.103, 1.1, 1.097, 1.094, 1.091, 1.088, 1.082, 1.075, 1.064, 1.059]
-    cs = CubicSpline(x_s_u_k_E, y_a_W)
-    return cs(s_u / k_E)
+    return CubicSpline(x_s_u_k_E, y_a_W)
+
+
+def a_W2(s_u, k_E):
+    """Table A.9 - Pipe spacing factor for system type B."""
+    return tables.get("iso_11855.a_W2")(s_u / k_E)
+
+
+@tables.register("iso_11855.b_u")
+def _b_u_table():
+    x_W = [0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
+    y_b_u = [1.0, 0.7, 0.5, 0.43, 0.25, 0.1, 0.0]
+    return CubicSpline(x_W, y_b_u)
 
 
 def b_u(W):
     """Table A.10 - Pipe spacing factor for system type B."""
-    if W <= 0.1:
-        return 1.0
-    elif W < 0.45:
-        x_W = [0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
-        y_b_u = [1.0, 0.7, 0.5, 0.43, 0.25, 0.1, 0.0]
-        cs = CubicSpline(x_W, y_b_u)
-        return cs(W)
-    else:
-        return 0.0
-
-
-def a_WL2(K_WL, W, D):
-    """Tables A.11 - A.15 - Heat conduction device factor for system type B."""
+    cs = tables.get("iso_11855.b_u")
+    return np.where(W <= 0.1, 1.0, np.where(W < 0.45, cs(W), 0.0))[()]
+
+
+@tables.register("iso_11855.a_WL2")
+def _a_WL2_table():
     x_K_WL = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
     y_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
     z_D = [0.014, 0.016, 0.018, 0.020, 0.022]
@@ -495,59 +528,77 @@ def a_WL2(K_WL, W, D):
             [0.81, 0.81, 0.81, 0.81, 0.81],
         ],
     ]
-    points = (x_K_WL, y_W, z_D)
-    point = np.array([K_WL, W, D])
-    # xyz change linear interpolation to quadratic spline
-    return float(interpn(points, a_WL, point, method="linear", bounds_error=False))
+    # points outside the tables are not defined by the standard
+    return GridInterpolator(
+        (x_K_WL, y_W, z_D), a_WL, method="linear", fill_value=np.nan
+    )
 
 
-def a_WL_inf(W):
-    """Table A.16 - Single column for K_WL = infinity."""
+def a_WL2(K_WL, W, D, method="linear"):
+    """Tables A.11 - A.15 - Heat conduction device factor for system type B."""
+    return tables.get("iso_11855.a_WL2")(K_WL, W, D, method=method)
+
+
+@tables.register("iso_11855.a_WL_inf")
+def _a_WL_inf_table():
     x_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
     y_a_WL_inf = [1, 1.01, 1.02, 1.04, 1.06, 1.07, 1.09, 1.1, 1.1]
-    cs = CubicSpline(x_W, y_a_WL_inf)
-    return cs(W)
+    return CubicSpline(x_W, y_a_WL_inf)
+
+
+def a_WL_inf(W):
+    """Table A.16 - Single column for K_WL = infinity."""
+    return tables.get("iso_11855.a_WL_inf")(W)
+
 
+@tables.register("iso_11855.a_WL3")
+def _a_WL3_table():
+    x_K_WL = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+    y_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
+    z_a_WL = [
+        [0.995, 0.998, 1.0, 1.0, 1.0, 1.0],
+        [0.979, 0.984, 0.99, 0.995, 0.998, 1.0],
+        [0.963, 0.972, 0.98, 0.988, 0.995, 1.0],
+        [0.924, 0.945, 0.96, 0.974, 0.99, 1.0],
+        [0.894, 0.921, 0.943, 0.961, 0.98, 1.0],
+        [0.88, 0.908, 0.934, 0.955, 0.975, 1.0],
+        [0.83, 0.87, 0.91, 0.94, 0.97, 1.0],
+        [0.815, 0.86, 0.9, 0.93, 0.97, 1.0],
+        [0.81, 0.86, 0.9, 0.93, 0.97, 1.0],
+    ]
+    return GridInterpolator((y_W, x_K_WL), z_a_WL)
 
-def a_WL3(K_WL, W, D):
+
+def a_WL3(K_WL, W, D, method="cubic", method_WL2="linear"):
     """Table A.16 - Heat conduction device factor for system type B, K_WL >= 0.5"""
-    if K_WL > 1:
-        a_WL_KL_inf = a_WL_inf(W)
-        a_WL_KL_0 = a_WL2(K_WL=0, W=W, D=D)
-        return (
-            a_WL_KL_inf
-            - (a_WL_KL_inf - a_WL_KL_0)
-            * ((a_WL_KL_inf - 1) / (a_WL_KL_inf - a_WL_KL_0)) ** K_WL
-        )
-
-    else:  # 0.5 <= K_WL <= 1
-        x_K_WL = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
-        y_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
-        z_a_WL = [
-            [0.995, 0.998, 1.0, 1.0, 1.0, 1.0],
-            [0.979, 0.984, 0.99, 0.995, 0.998, 1.0],
-            [0.963, 0.972, 0.98, 0.988, 0.995, 1.0],
-            [0.924, 0.945, 0.96, 0.974, 0.99, 1.0],
-            [0.894, 0.921, 0.943, 0.961, 0.98, 1.0],
-            [0.88, 0.908, 0.934, 0.955, 0.975, 1.0],
-            [0.83, 0.87, 0.91, 0.94, 0.97, 1.0],
-            [0.815, 0.86, 0.9, 0.93, 0.97, 1.0],
-            [0.81, 0.86, 0.9, 0.93, 0.97, 1.0],
-        ]
-        cs = interp2d(x_K_WL, y_W, z_a_WL, kind="cubic")
-        return float(cs(K_WL, W))
+    K_WL = np.asarray(K_WL, dtype=float)
+    # K_WL > 1
+    a_WL_KL_inf = a_WL_inf(W)
+    a_WL_KL_0 = a_WL2(K_WL=0, W=W, D=D, method=method_WL2)
+    a_WL = (
+        a_WL_KL_inf
+        - (a_WL_KL_inf - a_WL_KL_0)
+        * ((a_WL_KL_inf - 1) / (a_WL_KL_inf - a_WL_KL_0)) ** K_WL
+    )
+    # 0.5 <= K_WL <= 1
+    a_WL_1 = tables.get("iso_11855.a_WL3")(W, K_WL, method=method)
+    return np.where(K_WL > 1, a_WL, a_WL_1)[()]
 
 
-def a_K(W):
-    """Table A.17 - Correction factor for the contact for system type B."""
+@tables.register("iso_11855.a_K")
+def _a_K_table():
     x_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
     y_a_K = [1.0, 0.99, 0.98, 0.95, 0.92, 0.9, 0.82, 0.72, 0.60]
-    cs = CubicSpline(x_W, y_a_K)
-    return cs(W)
+    return CubicSpline(x_W, y_a_K)
 
 
-def B_G3(K_WL, W):
-    """Table A.18 - Coefficient for system type B."""
+def a_K(W):
+    """Table A.17 - Correction factor for the contact for system type B."""
+    return tables.get("iso_11855.a_K")(W)
+
+
+@tables.register("iso_11855.B_G3")
+def _B_G3_table():
     x_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
     y_K_WL = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3, 1.4, 1.5]
     z_B_G = [
@@ -567,12 +618,16 @@ def B_G3(K_WL, W):
         [100, 100, 99.8, 97.5, 92.5, 89.0, 80.0, 67.3, 50.5],
         [100, 100, 100, 98.6, 94.8, 91.7, 83.0, 71.0, 53.4],
     ]
-    cs = interp2d(x_W, y_K_WL, z_B_G, kind="cubic")
-    return float(cs(W, K_WL))
+    return GridInterpolator((y_K_WL, x_W), z_B_G)
 
 
-def n_G3(K_WL, W):
-    """Table A.19 - Exponent for system type B."""
+def B_G3(K_WL, W, method="cubic"):
+    """Table A.18 - Coefficient for system type B."""
+    return tables.get("iso_11855.B_G3")(K_WL, W, method=method)
+
+
+@tables.register("iso_11855.n_G3")
+def _n_G3_table():
     x_W = [0.05, 0.075, 0.1, 0.15, 0.2, 0.225, 0.3, 0.375, 0.45]
     y_K_WL = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3, 1.4, 1.5]
     z_n_G = [
@@ -592,8 +647,12 @@ def n_G3(K_WL, W):
         [0.0, 0.0, 0.002, 0.012, 0.022, 0.029, 0.047, 0.063, 0.080],
         [0.0, 0.0, 0.0, 0.009, 0.02, 0.025, 0.04, 0.055, 0.07],
     ]
-    cs = interp2d(x_W, y_K_WL, z_n_G, kind="cubic")
-    return float(cs(W, K_WL))
+    return GridInterpolator((y_K_WL, x_W), z_n_G)
+
+
+def n_G3(K_WL, W, method="cubic"):
+    """Table A.19 - Exponent for system type B."""
+    return tables.get("iso_11855.n_G3")(K_WL, W, method=method)
 
 
 def alfa(case_of_application="floor heating"):
@@ -623,7 +682,7 @@ def R_t2(R_w, R_r, R_x, U_1, U_2, m_H_sp, c):
     and average temperature of conductive later t_c."""
     U = 1 / (U_1 + U_2)
     mc = m_H_sp * c
-    return 1 / mc * (1 - exp(-1 / ((R_w + R_r + R_x + U) * mc))) - U
+    return 1 / (mc * (1 - np.exp(-1 / ((R_w + R_r + R_x + U) * mc)))) - U
 
 
 def q11(R_1, R_2, R_t, t_1, t_2, t_v):
@@ -647,18 +706,18 @@ def K_H3(R_w, R_r, R_x, R_i):
 
 def R_w1(W, d_a, s_r, m_H_sp, l):
     """Function B.6 - Resistance w for system E."""
-    return W**0.13 / 8 * pi * ((d_a - 2 * s_r) / (m_H_sp * l)) ** 0.87
+    return W**0.13 / (8 * pi) * ((d_a - 2 * s_r) / (m_H_sp * l)) ** 0.87
 
 
 def R_r1(W, d_a, s_r, k_r):
     """Function B.7 - Resistance r of pipe wall for system E."""
-    return W * log(d_a / (d_a - 2 * s_r)) / (2 * pi * k_r)
+    return W * np.log(d_a / (d_a - 2 * s_r)) / (2 * pi * k_r)
 
 
 def R_x1(W, d_a, k_b):
     """Function B.8 - Resistance x between pipe outside wall
     and conductive later for system E."""
-    return W * log(W / (pi * d_a)) / (2 * pi * k_b)
+    return W * np.log(W / (pi * d_a)) / (2 * pi * k_b)
 
 
 def U_i(h_i, s_i, k_b):
@@ -678,7 +737,7 @@ def R_w2(W, k_w, m_H_sp, c):
 
 def R_r2(W, d_a, s_r, k_r):
     """Function B.12 - Resistance r of pipe wall for system F."""
-    return W * log(d_a / (d_a - 2 * s_r)) / (2 * pi * k_r)
+    return W * np.log(d_a / (d_a - 2 * s_r)) / (2 * pi * k_r)
 
 
 def R_x2(W, d_a, k_l):
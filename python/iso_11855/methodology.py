@@ -1,8 +1,11 @@
 import iso_11855.functions as f
-from dataclasses import dataclass, field
+import numpy as np
+from numpy.typing import ArrayLike
+from dataclasses import dataclass, field, fields
+from utils.cache import LRUCache
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmbeddedPipe:
     name: str = "Default"
     external_diameter: float = 0.016 # External diameter of pipe [m]
@@ -11,11 +14,35 @@ class EmbeddedPipe:
 
 default_embedded_pipe = EmbeddedPipe()
 
+
+@dataclass(frozen=True)
+class EmbeddedRadiantGeometry:
+    """Construction of an embedded radiant system, K_H and B depend on it only."""
+    system_type: str
+    embedded_pipe: EmbeddedPipe
+    case_of_application: str
+    W: float
+    d_M: float
+    k_M: float
+    s_WL: float
+    k_WL: float
+    L_WL: float
+    s_u: float
+    R_k_B: float
+    k_E: float
+    psi: float
+    k_W: float
+
+
+# K_H and B of recently evaluated geometries
+heat_transmission_cache = LRUCache(maxsize=4096)
+
+
 @dataclass
 class EmbeddedRadiantSystem:
     name: str = 'Default'
     system_type: str = 'A' # System type (A, B, C, D, H, I, J)
-    embedded_pipe: EmbeddedPipe = field(default_factory=default_embedded_pipe)
+    embedded_pipe: EmbeddedPipe = field(default_factory=EmbeddedPipe)
     case_of_application: str = 'floor heating'
     W: float = 0.10 # Pipe spacing [m]
 
@@ -166,6 +193,23 @@ class EmbeddedRadiantSystem:
         else:
             return "There is no q system type: ", self.system_type
     
+    def supply_temperature(self, q, sigma=5.0):
+        """Supply temperature reaching the heat flux q
+        with the temperature drop sigma = t_V - t_R."""
+        return f.t_V(q / self.K_H, sigma, self.t_i)
+
+    def heat_flux(self, t_V, t_R, t_i=None):
+        """Heat flux for other, e.g. hourly, temperatures of the same geometry."""
+        t_i = self.t_i if t_i is None else t_i
+        t_V, t_R, t_i = (np.asarray(x, dtype=float) for x in (t_V, t_R, t_i))
+        return self.K_H * f.deltat_H(t_V, t_R, t_i)
+
+    @property
+    def geometry(self):
+        return EmbeddedRadiantGeometry(
+            **{x.name: getattr(self, x.name) for x in fields(EmbeddedRadiantGeometry)}
+        )
+
     def calc_K_H(self):
         K_H_Floor = self.calc_K_H_floor(R_k_b=0)
         R_k_b_star = 0.15
@@ -179,6 +223,310 @@ class EmbeddedRadiantSystem:
         # XYZ use ISO 6946 to calculate alfa for calculating q.
         self.alfa = f.alfa(self.case_of_application)
         self.D = max(self.embedded_pipe.external_diameter, self.d_M)
+        self.K_H, self.B = heat_transmission_cache.get(
+            self.geometry, lambda: (self.calc_K_H(), self.B)
+        )
+        self.deltat_H = f.deltat_H(self.t_V, self.t_R, self.t_i)
+        self.q = self.K_H * self.deltat_H
+
+
+def _lookup(table, *args):
+    """Evaluate a scalar table function once per unique combination of arguments."""
+    args = np.broadcast_arrays(*args)
+    points = np.stack([np.ravel(arg) for arg in args], axis=-1)
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    values = np.array([table(*point) for point in unique], dtype=float)
+    return values[inverse.ravel()].reshape(args[0].shape)
+
+
+@dataclass
+class EmbeddedRadiantSystemBatch:
+    """Arrays of embedded radiant systems evaluated in one vectorized pass.
+
+    Every design parameter may be given as a scalar or as an array, all of them
+    are broadcast against each other. The results follow EmbeddedRadiantSystem.
+    """
+
+    name: str = "Default"
+    system_type: ArrayLike = "A"  # System types (A, B, C, D, H, I, J)
+    embedded_pipe: EmbeddedPipe = field(default_factory=EmbeddedPipe)
+    case_of_application: ArrayLike = "floor heating"
+    W: ArrayLike = 0.10  # Pipe spacing [m]
+
+    # Sheathing
+    d_M: ArrayLike = 0.016  # External diameter of sheathing [m]
+    k_M: ArrayLike = 1.0  # Sheathing material conductivity [W/mK]
+
+    # heat diffusion device - only for system B
+    s_WL: ArrayLike = 0.002  # Thickness of the heat conducting material [m]
+    k_WL: ArrayLike = 50  # Thermal conductivity of the heat conducting material [W/mK]
+    L_WL: ArrayLike = 0.1  # Width of heat conducting device [m]
+
+    # covering
+    s_u: ArrayLike = 0.045  # Thickness of layer above the pipe [m]
+    R_k_B: ArrayLike = 0.1  # Thermal resistance of the floor covering [m2K/W]
+    k_E: ArrayLike = 1.8  # Thermal conductivity of screed [W/mK]
+
+    # fixing inserts
+    psi: ArrayLike = 0.05  # Volume ratio of the fixing inserts in the screed
+    k_W: ArrayLike = 0.5  # Thermal conductivity of the fixing inserts [W/mK]
+
+    # temperatures
+    t_i: ArrayLike = 20.0  # Design indoor temperature [*C]
+    t_V: ArrayLike = 40.0  # Design supply temperature of heating or cooling medium [*C]
+    t_R: ArrayLike = 35.0  # Design return temperature of heating or cooling medium [*C]
+
+    t_F_max: ArrayLike = 29.0  # Maximum surface temperature [*C]
+
+    # interpolation of the 2-D tables, "linear" is faster for screening runs
+    method: str = "cubic"
+    # interpolation of the 3-D type B tables A.11 - A.15
+    method_WL: str = "linear"
+
+    deltat_H: np.ndarray = field(init=False)  # Medium differential temperature [K]
+    q: np.ndarray = field(init=False)  # Heat flux [W/m2]
+    K_H: np.ndarray = field(init=False)  # Equivalent heat transmission coefficient.
+    B: np.ndarray = field(init=False)  # System dependent coefficient [W/m2K]
+    B_G: np.ndarray = field(init=False)  # Coefficient of the limit curve [W/m2K]
+    n_G: np.ndarray = field(init=False)  # Exponent of the limit curve
+    deltat_H_G: np.ndarray = field(init=False)  # Limit temperature difference [K]
+    q_G: np.ndarray = field(init=False)  # Limit heat flux [W/m2]
+
+    def k_E_ACHIJ(self, i):
+        """Screed conductivity with fixing inserts for system types A, C, H, I, J."""
+        psi = self.psi[i]
+        k_E_prim = f.k_E_prim(psi, self.k_E[i], self.k_W[i])
+        return np.where((0.05 <= psi) & (psi <= 0.15), k_E_prim, self.k_E[i])
+
+    def K_H_ACHIJ(self, R_k_b, i):
+        """Heat transfer coefficient for system types A, C, H, I, J."""
+        W, s_u = self.W[i], self.s_u[i]
+        k_E = self.k_E_ACHIJ(i)
+
+        # above W = 0.375 m the heat flux is scaled down with function A.10
+        W_0375 = np.minimum(W, 0.375)
+
+        a_B = f.a_B1(self.floor_alfa, k_E, R_k_b)
+        a_W = f.a_W1(R_k_b)
+        a_U = f.a_U1(R_k_b, W_0375, method=self.method)
+        a_D = f.a_D(R_k_b, W_0375, method=self.method)
+        m_W = f.m_W(W_0375)
+        m_U = f.m_U(s_u)
+        m_D = f.m_D(self.D[i])
+
+        a_i = [a_B, a_W, a_U, a_D]
+        m_i = [1, m_W, m_U, m_D]
+
+        B = f.B1(
+            B_0=self.B_0[i],
+            a_i=a_i,
+            m_i=m_i,
+            W=W_0375,
+            k_R=self.embedded_pipe.conductivity,
+            d_a=self.embedded_pipe.external_diameter,
+            s_R=self.embedded_pipe.wall_thickness,
+        )
+        q_0375 = f.q5(B, a_i, m_i, 1)
+        return B, np.where(W <= 0.375, q_0375, f.q8(q_0375, W))
+
+    def K_H_B(self, R_k_b, i):
+        """Heat transfer coefficient for system type B."""
+        W, s_u, k_E, D = self.W[i], self.s_u[i], self.k_E[i], self.D[i]
+
+        a_U = f.a_U2(self.floor_alfa, s_u, k_E)
+        a_W = f.a_W2(s_u, k_E)
+        b_u = f.b_u(W)
+        a_K = f.a_K(W)
+        K_WL = f.K_WL(self.s_WL[i], self.k_WL[i], b_u, s_u, k_E)
+        self.K_WL[i] = K_WL
+
+        m_W = np.where((0.05 <= W) & (W <= 0.45), f.m_W(R_k_b), np.nan)
+
+        a_WL = np.empty_like(W)
+        low = K_WL < 0.5
+        a_WL[low] = f.a_WL2(K_WL[low], W[low], D[low], method=self.method_WL)
+        a_WL[~low] = f.a_WL3(
+            K_WL[~low], W[~low], D[~low], method=self.method, method_WL2=self.method_WL
+        )
+
+        narrow = self.L_WL[i] < W
+        a_0 = f.a_WL2(0, W[narrow], D[narrow], method=self.method_WL)
+        a_WL[narrow] = f.a_WL1(a_WL[narrow], a_0, self.L_WL[i][narrow], W[narrow])
+
+        a_B = f.a_B2(a_U, a_W, m_W, a_WL, a_K, R_k_b, W)
+
+        a_i = [a_B, a_W, a_U, a_WL, a_K]
+        m_i = [1, m_W, 1, 1, 1]
+
+        B = f.B1(
+            B_0=self.B_0[i],
+            a_i=a_i,
+            m_i=m_i,
+            W=W,
+            k_R=self.embedded_pipe.conductivity,
+            d_a=self.embedded_pipe.external_diameter,
+            s_R=self.embedded_pipe.wall_thickness,
+        )
+        return B, f.q5(B, a_i, m_i, 1)
+
+    def K_H_D(self, R_k_b, i):
+        """Heat transfer coefficient for system type D."""
+        a_U = f.a_U2(self.floor_alfa, self.s_u[i], self.k_E[i])
+        a_B = f.a_B3(a_U, R_k_b)
+
+        a_i = [a_B, 1.06, a_U]
+        m_i = [1, 1, 1]
+
+        B = self.B_0[i]
+        return B, f.q5(B, a_i, m_i, 1)
+
+    def calc_K_H_floor(self, R_k_b):
+        B = np.full(self.shape, np.nan)
+        K_H_floor = np.full(self.shape, np.nan)
+        for types, K_H in [
+            ("ACHIJ", self.K_H_ACHIJ),
+            ("B", self.K_H_B),
+            ("D", self.K_H_D),
+        ]:
+            i = np.isin(self.system_type, list(types))
+            B[i], K_H_floor[i] = K_H(R_k_b, i)
+        return B, K_H_floor
+
+    def calc_K_H(self):
+        _, K_H_Floor = self.calc_K_H_floor(R_k_b=0)
+        R_k_b_star = 0.15
+        self.B, K_H_Floor_star = self.calc_K_H_floor(R_k_b_star)
+        deltaR_alfa = 1 / self.alfa - 1 / self.floor_alfa
+        return f.K_H2(K_H_Floor, deltaR_alfa, self.R_k_B, K_H_Floor_star, R_k_b_star)
+
+    def calc_limit_curve(self):
+        """Coefficient B_G and exponent n_G of the limit curve.
+        Pipe spacings above 0.375 m use the tables at W = 0.375 m,
+        see calc_limit."""
+        B_G = np.full(self.shape, np.nan)
+        n_G = np.full(self.shape, np.nan)
+
+        i = np.isin(self.system_type, list("ACHIJ"))
+        s_u, W = self.s_u[i], np.minimum(self.W[i], 0.375)
+        k_E = self.k_E_ACHIJ(i)
+        thin = s_u / k_E <= 0.0792
+        B_G[i] = np.where(
+            thin, f.B_G1(s_u, k_E, W, method=self.method), f.B_G2(s_u, W)
+        )
+        n_G[i] = np.where(
+            thin, f.n_G1(s_u, k_E, W, method=self.method), f.n_G2(s_u, W)
+        )
+
+        i = self.system_type == "B"
+        B_G[i] = f.B_G3(self.K_WL[i], self.W[i], method=self.method)
+        n_G[i] = f.n_G3(self.K_WL[i], self.W[i], method=self.method)
+
+        i = self.system_type == "D"
+        B_G[i] = 100.0
+        n_G[i] = 0.0
+        return B_G, n_G
+
+    def calc_limit(self):
+        """Intersection of the characteristic curve with the limit curve."""
+        fi = f.fi(self.t_F_max, self.t_i)
+
+        # above W = 0.375 m the limit follows from the one at 0.375 m
+        wide = np.isin(self.system_type, list("ACHIJ")) & (self.W > 0.375)
+        K_H = np.where(wide, self.K_H * self.W / 0.375, self.K_H)
+
+        # Function A.21 with the characteristic curve q = K_H * deltat_H
+        deltat_H_G = fi * (self.B_G / K_H) ** (1 / (1 - self.n_G))
+        q_G = f.q_G1(fi, self.B_G, deltat_H_G, self.n_G)
+
+        # 100 * fi is the limit heat flux of an even surface temperature t_F_max
+        f_G = f.f_G(self.s_u, self.W, 100 * fi, q_G)
+        return (
+            np.where(wide, f.deltat_H_G(deltat_H_G, f_G), deltat_H_G),
+            np.where(wide, f.q_G2(q_G, self.W, f_G), q_G),
+        )
+
+    def supply_temperature(self, q, sigma=5.0):
+        """Supply temperature of every system reaching every heat flux
+        of the array q with the temperature drop sigma = t_V - t_R.
+        Targets above q_G exceed the surface temperature limit."""
+        q = np.asarray(q, dtype=float)
+        expand = (...,) + (None,) * q.ndim
+        return f.t_V(q / self.K_H[expand], sigma, self.t_i[expand])
+
+    def characteristic_curve(self, deltat_H):
+        """Heat flux of every system over the array of deltat_H, function A.9."""
+        return np.multiply.outer(self.K_H, deltat_H)
+
+    def limit_curve(self, deltat_H):
+        """Limit heat flux of every system over the array of deltat_H.
+        Function A.19 passing through the limit point (deltat_H_G, q_G)."""
+        deltat_H = np.asarray(deltat_H, dtype=float)
+        expand = (...,) + (None,) * deltat_H.ndim
+        return (
+            self.q_G[expand]
+            * (deltat_H / self.deltat_H_G[expand]) ** self.n_G[expand]
+        )
+
+    def __post_init__(self) -> None:
+        (
+            self.system_type,
+            self.case_of_application,
+            self.W,
+            self.d_M,
+            self.k_M,
+            self.s_WL,
+            self.k_WL,
+            self.L_WL,
+            self.s_u,
+            self.R_k_B,
+            self.k_E,
+            self.psi,
+            self.k_W,
+            self.t_i,
+            self.t_V,
+            self.t_R,
+            self.t_F_max,
+        ) = np.broadcast_arrays(
+            np.asarray(self.system_type, dtype=str),
+            np.asarray(self.case_of_application, dtype=str),
+            *[
+                np.asarray(x, dtype=float)
+                for x in (
+                    self.W,
+                    self.d_M,
+                    self.k_M,
+                    self.s_WL,
+                    self.k_WL,
+                    self.L_WL,
+                    self.s_u,
+                    self.R_k_B,
+                    self.k_E,
+                    self.psi,
+                    self.k_W,
+                    self.t_i,
+                    self.t_V,
+                    self.t_R,
+                    self.t_F_max,
+                )
+            ],
+        )
+        self.shape = self.W.shape
+
+        self.B_0 = np.select(
+            [
+                np.isin(self.system_type, list("ACHIJ")),
+                np.isin(self.system_type, list("BD")),
+            ],
+            [6.7, 6.5],
+            np.nan,
+        )
+        self.floor_alfa = f.alfa("floor heating")
+        self.alfa = _lookup(f.alfa, self.case_of_application)
+        self.D = np.maximum(self.embedded_pipe.external_diameter, self.d_M)
+        self.K_WL = np.full(self.shape, np.nan)
         self.K_H = self.calc_K_H()
         self.deltat_H = f.deltat_H(self.t_V, self.t_R, self.t_i)
-        self.q = self.K_H * self.deltat_H
\ No newline at end of file
+        self.q = self.K_H * self.deltat_H
+
+        self.B_G, self.n_G = self.calc_limit_curve()
+        self.deltat_H_G, self.q_G = self.calc_limit()
@@ -0,0 +1,201 @@
+import iso_11855.functions as f
+import numpy as np
+from numpy.typing import ArrayLike
+from iso_11855.methodology import EmbeddedPipe
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TABSResults:
+    """Hourly or sub-hourly results of one chunk of time steps,
+    arrays of shape (steps, slabs)."""
+
+    start: int  # Index of the first time step of the chunk
+    t_c: np.ndarray  # Temperature of the conductive layer at the end of the step [*C]
+    t_s1: np.ndarray  # Surface temperature towards space 1 [*C]
+    t_s2: np.ndarray  # Surface temperature towards space 2 [*C]
+    t_r: np.ndarray  # Return temperature of the water, NaN when not operating [*C]
+    q_1: np.ndarray  # Heat flux into space 1 [W/m2]
+    q_2: np.ndarray  # Heat flux into space 2 [W/m2]
+    q_w: np.ndarray  # Heat flux from the water into the slab [W/m2]
+
+
+@dataclass
+class ThermallyActiveSlab:
+    """Thermally activated building systems E and F (Annex B) of one
+    or more slabs, the slab is lumped into a single heat capacity
+    at the level of the pipes."""
+
+    name: str = "Default"
+    system_type: ArrayLike = "E"  # System type (E, F)
+    embedded_pipe: EmbeddedPipe = field(default_factory=EmbeddedPipe)
+    W: ArrayLike = 0.15  # Pipe spacing [m]
+    m_H_sp: ArrayLike = 0.0033  # Specific water flow [kg/m2s]
+    l: ArrayLike = 100.0  # Length of the pipe circuit [m]
+    c: ArrayLike = 4190.0  # Specific heat capacity of water [J/kgK]
+    k_w: ArrayLike = 0.6  # Thermal conductivity of water [W/mK]
+
+    # slab
+    k_b: ArrayLike = 1.8  # Thermal conductivity of the slab [W/mK]
+    s_1: ArrayLike = 0.1  # Thickness of the slab above the pipes [m]
+    s_2: ArrayLike = 0.1  # Thickness of the slab below the pipes [m]
+    rho_c_b: ArrayLike = 2.0e6  # Volumetric heat capacity of the slab [J/m3K]
+
+    # conductive layer - only for system F
+    s_l: ArrayLike = 0.01  # Thickness of the conductive layer [m]
+    k_l: ArrayLike = 1.0  # Thermal conductivity of the conductive layer [W/mK]
+
+    # surfaces
+    h_1: ArrayLike = 10.8  # Heat transfer coefficient towards space 1 [W/m2K]
+    h_2: ArrayLike = 6.5  # Heat transfer coefficient towards space 2 [W/m2K]
+
+    R_t: np.ndarray = field(init=False)  # Resistance water - conductive layer [m2K/W]
+    U_1: np.ndarray = field(init=False)  # Heat transfer coefficient to space 1 [W/m2K]
+    U_2: np.ndarray = field(init=False)  # Heat transfer coefficient to space 2 [W/m2K]
+    C: np.ndarray = field(init=False)  # Heat capacity of the slab [J/m2K]
+    K_H: np.ndarray = field(init=False)  # Equivalent heat transmission coefficient
+
+    def calc_resistances(self):
+        """Resistances of function B.1 for every slab."""
+        pipe = self.embedded_pipe
+        d_a, s_r, k_r = pipe.external_diameter, pipe.wall_thickness, pipe.conductivity
+        E = self.system_type == "E"
+        W, mc = self.W, self.m_H_sp * self.c
+
+        R_w = np.where(
+            E,
+            f.R_w1(W, d_a, s_r, self.m_H_sp, self.l),
+            f.R_w2(W, self.k_w, self.m_H_sp, self.c),
+        )
+        R_r = np.where(E, f.R_r1(W, d_a, s_r, k_r), f.R_r2(W, d_a, s_r, k_r))
+        R_x = np.where(E, f.R_x1(W, d_a, self.k_b), f.R_x2(W, d_a, self.k_l))
+        U_1 = np.where(
+            E,
+            f.U_i(self.h_1, self.s_1, self.k_b),
+            f.U_1(self.h_1, self.s_1, self.k_b, self.s_l, self.k_l),
+        )
+        U_2 = np.where(
+            E, f.U_i(self.h_2, self.s_2, self.k_b), f.U_2(self.h_2, self.s_l, self.k_l)
+        )
+
+        # function B.2 replaces B.1 for low water flows
+        R_z = 1 / (2 * mc)
+        low_flow = mc * (R_w + R_r + R_x + 1 / (U_1 + U_2)) < 0.5
+        R_t = np.where(
+            low_flow,
+            f.R_t2(R_w, R_r, R_x, U_1, U_2, self.m_H_sp, self.c),
+            f.R_t1(R_z, R_w, R_r, R_x),
+        )
+        return R_w, R_r, R_x, R_t, U_1, U_2
+
+    def steady_state(self, t_v, t_1, t_2):
+        """Functions B.3 and B.4 - Steady state heat fluxes into the adjacent spaces."""
+        R_1, R_2 = f.R_i(self.U_1), f.R_i(self.U_2)
+        return (
+            f.q11(R_1, R_2, self.R_t, t_1, t_2, t_v),
+            f.q12(R_1, R_2, self.R_t, t_1, t_2, t_v),
+        )
+
+    def _step_factors(self, dt, operation):
+        """Decay of the slab temperature over a step and its step mean factor."""
+        G = np.where(operation, 1 / self.R_t, 0) + self.U_1 + self.U_2
+        x = G * dt / self.C
+        return G, np.exp(-x), -np.expm1(-x) / x
+
+    def simulate(
+        self, t_v, t_1, t_2, operation=True, dt=3600.0, t_c_0=None, chunk_size=744
+    ):
+        """Time stepping of the slabs, yielding TABSResults chunk by chunk.
+
+        t_v, t_1, t_2 and operation are scalars, series over the time steps
+        or arrays of shape (steps, slabs). Inputs are constant over a step
+        and the slab temperature is integrated exactly within it."""
+        series = [_series(x) for x in (t_v, t_1, t_2, operation)]
+        shape = np.broadcast_shapes(*(x.shape for x in series), (1, self.C.size))
+        t_v, t_1, t_2, operation = (np.broadcast_to(x, shape) for x in series)
+
+        G_t = 1 / self.R_t
+        t_c = np.broadcast_to(
+            (t_1[0] + t_2[0]) / 2 if t_c_0 is None else t_c_0, shape[1:]
+        ).astype(float)
+
+        for start in range(0, shape[0], chunk_size):
+            k = slice(start, start + chunk_size)
+            on = operation[k].astype(bool)
+            G, decay, mean = self._step_factors(dt, on)
+            G_w = np.where(on, G_t, 0)
+            # the supply temperature may be left undefined while not operating
+            t_w = np.where(on, t_v[k], 0)
+            t_eq = (G_w * t_w + self.U_1 * t_1[k] + self.U_2 * t_2[k]) / G
+
+            # only the recurrence of the slab temperature runs step by step
+            t_c_end = np.empty_like(t_eq)
+            t_c_mean = np.empty_like(t_eq)
+            for n in range(len(t_eq)):
+                t_c_mean[n] = t_eq[n] + (t_c - t_eq[n]) * mean[n]
+                t_c = t_eq[n] + (t_c - t_eq[n]) * decay[n]
+                t_c_end[n] = t_c
+
+            q_1 = self.U_1 * (t_c_mean - t_1[k])
+            q_2 = self.U_2 * (t_c_mean - t_2[k])
+            q_w = G_w * (t_w - t_c_mean)
+            yield TABSResults(
+                start=start,
+                t_c=t_c_end,
+                t_s1=t_1[k] + q_1 / self.h_1,
+                t_s2=t_2[k] + q_2 / self.h_2,
+                t_r=np.where(on, t_w - q_w / (self.m_H_sp * self.c), np.nan),
+                q_1=q_1,
+                q_2=q_2,
+                q_w=q_w,
+            )
+
+    def __post_init__(self) -> None:
+        (
+            self.system_type,
+            self.W,
+            self.m_H_sp,
+            self.l,
+            self.c,
+            self.k_w,
+            self.k_b,
+            self.s_1,
+            self.s_2,
+            self.rho_c_b,
+            self.s_l,
+            self.k_l,
+            self.h_1,
+            self.h_2,
+        ) = np.broadcast_arrays(
+            np.atleast_1d(self.system_type),
+            *(
+                np.atleast_1d(np.asarray(x, dtype=float))
+                for x in (
+                    self.W,
+                    self.m_H_sp,
+                    self.l,
+                    self.c,
+                    self.k_w,
+                    self.k_b,
+                    self.s_1,
+                    self.s_2,
+                    self.rho_c_b,
+                    self.s_l,
+                    self.k_l,
+                    self.h_1,
+                    self.h_2,
+                )
+            ),
+        )
+        self.R_w, self.R_r, self.R_x, self.R_t, self.U_1, self.U_2 = (
+            self.calc_resistances()
+        )
+        s_l = np.where(self.system_type == "F", self.s_l, 0.0)
+        self.C = self.rho_c_b * (self.s_1 + self.s_2 + s_l)
+        self.K_H = f.K_H3(self.R_w, self.R_r, self.R_x, f.R_i(self.U_1 + self.U_2))
+
+
+def _series(x):
+    """Time series as a column, so that it broadcasts over the slabs."""
+    x = np.asarray(x)
+    return x[:, None] if x.ndim == 1 else np.atleast_2d(x)
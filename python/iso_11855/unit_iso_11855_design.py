@@ -0,0 +1,20 @@
+from design import *
+
+rooms = [
+    Room(name="Living room", q_des=60.0),
+    Room(name="Bathroom", q_des=90.0, t_i=24.0, R_k_B=0.02, t_F_max=33.0),
+    Room(name="Bedroom", q_des=40.0, R_k_B=0.15),
+]
+space = DesignSpace(system_types=("A", "B"))
+
+if __name__ == "__main__":
+    for design in optimize_rooms(rooms, space):
+        print(
+            design.room.name + ":",
+            design.system_type,
+            design.W,
+            design.s_u,
+            design.t_V,
+            round(design.q, 2),
+            "W/m2",
+        )
@@ -1,3 +1,8 @@
 from functions import *
 
 print(n_G3(K_WL=2, W=1))
+print(a_U1(R_k_B=0.1, W=[0.05, 0.1, 0.375]))
+print(a_U1(R_k_B=0.1, W=[0.05, 0.1, 0.375], method="linear"))
+print(a_WL2(K_WL=[0.0, 0.25, 0.5], W=0.12, D=0.016))
+print(a_WL2(K_WL=[0.0, 0.25, 0.5], W=0.12, D=0.016, method="quadratic"))
+print(a_WL3(K_WL=[0.7, 1.5], W=0.1, D=0.016))
@@ -39,3 +39,39 @@ System A: 68.59 W/m2
 System B: 69.30 W/m2
 System D: 77.58 W/m2
 """
+
+UFH_batch = EmbeddedRadiantSystemBatch(
+    name="Systems A, B, D",
+    system_type=["A", "B", "D"],
+    embedded_pipe=embedded_pipe,
+    case_of_application=case_of_application,
+    W=W,
+)
+
+print(UFH_batch.name + ":", UFH_batch.q.round(2), "W/m2")
+
+"""
+Systems A, B, D: [68.59 69.3  77.58] W/m2
+"""
+
+deltat_H = [5, 10, 15, 20]
+print("Characteristic curves:", UFH_batch.characteristic_curve(deltat_H).round(1))
+print("Limit curves:", UFH_batch.limit_curve(deltat_H).round(1))
+print("Supply temperatures:", UFH_batch.supply_temperature([40, 60], sigma=5).round(1))
+
+# hourly heat flux of system A, K_H of the instance is reused, only deltat_H is recomputed
+t_V_hourly = [40.0, 38.0, 35.0, 32.0]
+print("Hourly heat flux:", UFH_A.heat_flux(t_V_hourly, [35.0, 33.0, 30.5, 28.0]).round(2))
+
+# a second system of the same geometry takes K_H from the geometry cache
+print("Geometry cache:", heat_transmission_cache.info())
+UFH_A2 = EmbeddedRadiantSystem(
+    name="System A at 45/40",
+    system_type="A",
+    embedded_pipe=embedded_pipe,
+    case_of_application=case_of_application,
+    W=W,
+    t_V=45.0,
+    t_R=40.0
+)
+print("Geometry cache:", heat_transmission_cache.info())
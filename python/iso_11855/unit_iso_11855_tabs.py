@@ -0,0 +1,31 @@
+import numpy as np
+from tabs import *
+
+TABS = ThermallyActiveSlab(name="Slabs E and F", system_type=["E", "F"], W=[0.15, 0.02])
+
+print(TABS.name + ":", "R_t =", TABS.R_t.round(4), "m2K/W")
+print(TABS.name + ":", "K_H =", TABS.K_H.round(2), "W/m2K")
+
+# a year of hourly steps, water supplied at night only
+hour = np.arange(8760)
+operation = hour % 24 < 8
+t_v = np.where(operation, 28.0, np.nan)
+t_1 = 21 + 2 * np.sin(2 * np.pi * hour / 24)
+
+q_1 = np.zeros(2)
+t_s1_max = np.full(2, -np.inf)
+for results in TABS.simulate(t_v, t_1, 21.0, operation=operation):
+    q_1 += results.q_1.sum(axis=0) / 1000
+    t_s1_max = np.maximum(t_s1_max, results.t_s1.max(axis=0))
+
+print("Heat supplied to space 1:", q_1.round(1), "kWh/m2")
+print("Maximum surface temperature:", t_s1_max.round(2), "*C")
+
+# the simulation settles on the steady state of functions B.3 and B.4
+results = next(TABS.simulate(np.full(100, 28.0), 21.0, 21.0))
+q_11, q_12 = TABS.steady_state(28.0, 21.0, 21.0)
+print("Steady state:", results.q_1[-1].round(2), q_11.round(2))
+
+"""
+Steady state: [25.82 29.69] [25.82 29.69]
+"""
@@ -1,4 +1,5 @@
-from math import log, cos, sin, sqrt, pi, e
+import numpy as np
+from numpy import log, cos, sin, sqrt, pi, e
 
 
 def H_g1(A, U, P, Psi_wf):
@@ -40,10 +41,12 @@ def U_fg_sog2(k_g, B, d_f):
 
 def U_fg_sog(k_g, B, d_f):
     """Functions 4 and 5 - Hard core thermal transmittance."""
-    if d_f < B:
-        return U_fg_sog1(k_g=k_g, B=B, d_f=d_f)
-    else:
-        return U_fg_sog2(k_g=k_g, B=B, d_f=d_f)
+    U = np.where(
+        np.less(d_f, B),
+        U_fg_sog1(k_g=k_g, B=B, d_f=d_f),
+        U_fg_sog2(k_g=k_g, B=B, d_f=d_f),
+    )
+    return U[()]
 
 
 # Functions 6-7 are alternative functions to function 5.
@@ -71,7 +74,7 @@ def U_x(h, U_w, B, epsilon, v, f_w):
 
 def f_w(location):
     """Table 8 - Wind shielding factor."""
-    switcher = {"sheltered": 0.02, "horizontal": 0.05, "downwards": 0.1}
+    switcher = {"sheltered": 0.02, "average": 0.05, "exposed": 0.1}
     return switcher.get(location.lower())
 
 
@@ -88,9 +91,19 @@ def U_fg_b2(k_g, B, d_f, z):
     return k_g / (0.457 * B + d_f + 0.5 * z)
 
 
+def U_fg_b(k_g, B, d_f, z):
+    """Functions 13 and 14 - Hard core thermal transmittance."""
+    U = np.where(
+        np.less(d_f + 0.5 * z, B),
+        U_fg_b1(k_g=k_g, B=B, d_f=d_f, z=z),
+        U_fg_b2(k_g=k_g, B=B, d_f=d_f, z=z),
+    )
+    return U[()]
+
+
 def d_w_b(k_g, R_si, R_w_b, R_se):
     """Function 15 - Total equivalent thickness for the basement walls."""
-    return k_g * (R_si + R_w_b, R_se)
+    return k_g * (R_si + R_w_b + R_se)
 
 
 def U_wg_b(k_g, z, d_f, d_w_b):
@@ -178,7 +191,7 @@ def gamma(n):
 
 def Phi_s_c(H_g, H_pi, H_pe, t_int_ann_ave, t_int_amp, t_e_ann_ave, t_e_amp, gamma):
     """Function C.7 - Average heat flor rate over cooling season."""
-    return H_g * (t_int_ann_ave - t_e_ann_ave) - gamma * (
+    return H_g * (t_int_ann_ave - t_e_ann_ave) + gamma * (
         H_pi * t_int_amp - H_pe * t_e_amp
     )
 
@@ -275,7 +288,7 @@ def t_us_ann_ave(
     return numerator / denominator
 
 
-def U_g(U_fg_b, z, P, U_wg_b, A):
+def U_g2(U_fg_b, z, P, U_wg_b, A):
     """Function G.2 - Thermal transmitance of the ground."""
     return U_fg_b + z * P * U_wg_b / A
 
@@ -365,7 +378,7 @@ def H_pe3(P, k_g, d_f, sigma, d, D):
 def H_pi2(A, U_f_sus, k_g, sigma, U_x):
     """Function H.6 - Internal periodic heat transfer coefficient
     for suspended floor."""
-    return A * (1 / U_f_sus + 1 / (k_g / sigma + U_x))
+    return A / (1 / U_f_sus + 1 / (k_g / sigma + U_x))
 
 
 def H_pe4(U_f, P, k_g, sigma, d_g, U_x, A):
@@ -374,7 +387,7 @@ def H_pe4(U_f, P, k_g, sigma, d_g, U_x, A):
     return (
         U_f
         * (0.37 * P * k_g * log(sigma / d_g + 1) + U_x * A)
-        / (k_g / (sigma + U_x + U_f))
+        / (k_g / sigma + U_x + U_f)
     )
 
 
@@ -402,7 +415,7 @@ def H_pi4(A, U_f_s, z, P, k_g, sigma, h, U_w, n, V):
     )
 
 
-def H_pe6(A, U_f_s, z, P, k_g, sigma, h, U_w, n, V, U_f_sus):
+def H_pe6(A, U_f_s, z, P, k_g, sigma, h, U_w, n, V, U_f_sus, d_f):
     """Function H.11 - External periodic heat transfer coefficient
     for the unheated basement."""
     x = h * P * U_w + 0.33 * n * V
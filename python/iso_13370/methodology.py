@@ -1,12 +1,22 @@
 import iso_13370.functions as f
-from iso_6946.methodology import Construction
+import numpy as np
+from iso_6946.methodology import Construction, ConstructionTable
 from dataclasses import dataclass, field
+from numpy.typing import ArrayLike
+
+MONTHS = np.arange(1, 13)
 
 
 @dataclass
 class Ground:
     name: str
     conductivity: float
+    heat_capacity: float = 2.0e6  # Volumetric heat capacity [J/m3K]
+
+    sigma: float = field(init=False)  # Periodic penetration depth [m]
+
+    def __post_init__(self) -> None:
+        self.sigma = f.sigma1(k_g=self.conductivity, rho=self.heat_capacity, c=1)
 
 
 @dataclass
@@ -18,10 +28,14 @@ class SlabOnGroundFloor:
     construction: Construction
     d_w_e: float
     R_f_sog: float
+    Psi_wf: float = 0.0  # Linear thermal transmittance of the wall/floor junction
 
     B: float = field(init=False)
     d_f: float = field(init=False)
     U_fg_sog: float = field(init=False)
+    H_g: float = field(init=False)  # Steady state ground heat transfer coefficient
+    H_pi: float = field(init=False)  # Internal periodic heat transfer coefficient
+    H_pe: float = field(init=False)  # External periodic heat transfer coefficient
 
     def __post_init__(self) -> None:
         self.B = f.B(A=self.area, P=self.perimeter)
@@ -33,6 +47,106 @@ class SlabOnGroundFloor:
             R_se=0,
         )
         self.U_fg_sog = f.U_fg_sog(k_g=self.ground.conductivity, B=self.B, d_f=self.d_f)
+        self.H_g = f.H_g1(
+            A=self.area, U=self.U_fg_sog, P=self.perimeter, Psi_wf=self.Psi_wf
+        )
+        k_g, sigma = self.ground.conductivity, self.ground.sigma
+        self.H_pi = f.H_pi1(A=self.area, k_g=k_g, d_f=self.d_f, sigma=sigma)
+        self.H_pe = f.H_pe1(P=self.perimeter, k_g=k_g, d_f=self.d_f, sigma=sigma)
+
+
+@dataclass
+class SlabOnGroundFloorBatch:
+    """Slab on ground floors of a building stock evaluated at once,
+    the inputs broadcast against each other. Without R_f_sog the floor
+    resistance is the R of the constructions table."""
+
+    area: ArrayLike  # [m2]
+    perimeter: ArrayLike  # Exposed perimeter [m]
+    conductivity: ArrayLike  # Thermal conductivity of the ground [W/mK]
+    d_w_e: ArrayLike  # Thickness of the external walls [m]
+    R_f_sog: ArrayLike = None  # Thermal resistance of the floor [m2K/W]
+    constructions: ConstructionTable = None  # Floor constructions, one per floor
+    heat_capacity: ArrayLike = 2.0e6  # Volumetric heat capacity of the ground [J/m3K]
+    Psi_wf: ArrayLike = 0.0  # Linear thermal transmittance of the wall/floor junction
+
+    R: np.ndarray = field(init=False)  # Thermal resistance of the constructions
+    sigma: np.ndarray = field(init=False)  # Periodic penetration depth [m]
+    B: np.ndarray = field(init=False)
+    d_f: np.ndarray = field(init=False)
+    U_fg_sog: np.ndarray = field(init=False)
+    H_g: np.ndarray = field(init=False)  # Steady state ground heat transfer coefficient
+    H_pi: np.ndarray = field(init=False)  # Internal periodic heat transfer coefficient
+    H_pe: np.ndarray = field(init=False)  # External periodic heat transfer coefficient
+
+    def __post_init__(self) -> None:
+        if self.constructions is not None:
+            self.R = self.constructions.R
+        elif self.R_f_sog is not None:
+            self.R = np.asarray(self.R_f_sog, dtype=float)
+        else:
+            raise ValueError("Either R_f_sog or constructions is required.")
+        R_f_sog = self.R if self.R_f_sog is None else self.R_f_sog
+
+        A, P, k_g = (
+            np.asarray(x, dtype=float)
+            for x in (self.area, self.perimeter, self.conductivity)
+        )
+        self.sigma = f.sigma1(k_g=k_g, rho=self.heat_capacity, c=1)
+        self.B = f.B(A=A, P=P)
+        self.d_f = f.d_f(d_w_e=self.d_w_e, k_g=k_g, R_si=0.1, R_f_sog=R_f_sog, R_se=0)
+        self.U_fg_sog = f.U_fg_sog(k_g=k_g, B=self.B, d_f=self.d_f)
+        self.H_g = f.H_g1(A=A, U=self.U_fg_sog, P=P, Psi_wf=self.Psi_wf)
+        self.H_pi = f.H_pi1(A=A, k_g=k_g, d_f=self.d_f, sigma=self.sigma)
+        self.H_pe = f.H_pe1(P=P, k_g=k_g, d_f=self.d_f, sigma=self.sigma)
+
+    def __len__(self) -> int:
+        return np.size(self.U_fg_sog)
+
+
+def _suspended_floor(A, P, k_g, sigma, d_w_e, U_f_sus, R_g, h, U_w, epsilon, v, f_w):
+    """Functions 8-11, H.6 and H.7 of suspended floors."""
+    B = f.B(A=A, P=P)
+    d_g = f.d_g(d_w_e=d_w_e, k_g=k_g, R_si=0.17, R_f_ins=R_g, R_se=0.04)
+    U_g = f.U_g(k_g=k_g, B=B, d_g=d_g)
+    U_x = f.U_x(h=h, U_w=U_w, B=B, epsilon=epsilon, v=v, f_w=f_w)
+    U = f.U_fg_sus(U_f_sus=U_f_sus, U_g=U_g, U_x=U_x)
+    H_pi = f.H_pi2(A=A, U_f_sus=U_f_sus, k_g=k_g, sigma=sigma, U_x=U_x)
+    H_pe = f.H_pe4(U_f=U_f_sus, P=P, k_g=k_g, sigma=sigma, d_g=d_g, U_x=U_x, A=A)
+    return B, d_g, U_g, U_x, U, H_pi, H_pe
+
+
+def _basement(A, P, k_g, d_w_e, z, R_f_b, R_w_b):
+    """Functions 12-16 of the floor and walls of basements."""
+    B = f.B(A=A, P=P)
+    d_f = f.d_f(d_w_e=d_w_e, k_g=k_g, R_si=0.17, R_f_sog=R_f_b, R_se=0.04)
+    d_w_b = f.d_w_b(k_g=k_g, R_si=0.13, R_w_b=R_w_b, R_se=0.04)
+    U_fg_b = f.U_fg_b(k_g=k_g, B=B, d_f=d_f, z=z)
+    U_wg_b = f.U_wg_b(k_g=k_g, z=z, d_f=d_f, d_w_b=d_w_b)
+    return B, d_f, d_w_b, U_fg_b, U_wg_b
+
+
+def _heated_basement(A, P, k_g, sigma, d_w_e, z, R_f_b, R_w_b, Psi_wf):
+    """Functions 12-18, H.8 and H.9 of heated basements."""
+    B, d_f, d_w_b, U_fg_b, U_wg_b = _basement(A, P, k_g, d_w_e, z, R_f_b, R_w_b)
+    U = f.U_bg_eff(A=A, U_f_b=U_fg_b, z=z, P=P, U_w_b=U_wg_b)
+    H_g = f.H_g2(A=A, U_fg_b=U_fg_b, z=z, P=P, U_wg_b=U_wg_b, Psi_w_f=Psi_wf)
+    H_pi = f.H_pi3(A=A, k_g=k_g, d_f=d_f, sigma=sigma, z=z, P=P, d_w=d_w_b)
+    H_pe = f.H_pe5(k_g=k_g, d_f=d_f, sigma=sigma, z=z, P=P, d_w=d_w_b)
+    return B, d_f, d_w_b, U_fg_b, U_wg_b, U, H_g, H_pi, H_pe
+
+
+def _unheated_basement(A, P, k_g, sigma, d_w_e, z, R_f_b, R_w_b, U_f_sus, h, U_w, n, V):
+    """Functions 12-16, 19, H.10 and H.11 of unheated basements,
+    the air change rate n is per hour."""
+    B, d_f, d_w_b, U_fg_b, U_wg_b = _basement(A, P, k_g, d_w_e, z, R_f_b, R_w_b)
+    # 0.33 Wh/m3K is the heat capacity of air for n per hour
+    U = f.U_ub(U_f_sus, A, U_fg_b, z, P, U_wg_b, h, U_w, c_p=0.33, rho=1, n=n, V=V)
+    H_pi = f.H_pi4(
+        A=A, U_f_s=U_f_sus, z=z, P=P, k_g=k_g, sigma=sigma, h=h, U_w=U_w, n=n, V=V
+    )
+    H_pe = f.H_pe6(A, U_f_sus, z, P, k_g, sigma, h, U_w, n, V, U_f_sus, d_f)
+    return B, d_f, d_w_b, U_fg_b, U_wg_b, U, H_pi, H_pe
 
 
 @dataclass
@@ -41,11 +155,43 @@ class SuspendedFloor:
     area: float
     perimeter: float
     ground: Ground
+    d_w_e: float = 0.3  # Thickness of the external walls [m]
+    U_f_sus: float = 0.3  # Thermal transmittance of the suspended part [W/m2K]
+    R_g: float = 0.0  # Thermal resistance of the insulation on the ground [m2K/W]
+    h: float = 0.3  # Height of the floor above the external ground [m]
+    U_w: float = 1.5  # Thermal transmittance of the underfloor walls [W/m2K]
+    epsilon: float = 0.003  # Area of ventilation openings per perimeter [m2/m]
+    v: float = 4.0  # Average wind speed at 10 m height [m/s]
+    f_w: float = 0.05  # Wind shielding factor, Table 8
+    Psi_wf: float = 0.0  # Linear thermal transmittance of the wall/floor junction
 
     B: float = field(init=False)
+    d_g: float = field(init=False)
+    U_g: float = field(init=False)
+    U_x: float = field(init=False)
+    U: float = field(init=False)  # Thermal transmittance of the floor
+    H_g: float = field(init=False)  # Steady state ground heat transfer coefficient
+    H_pi: float = field(init=False)  # Internal periodic heat transfer coefficient
+    H_pe: float = field(init=False)  # External periodic heat transfer coefficient
 
     def __post_init__(self) -> None:
-        self.B: float = f.B(A=self.area, P=self.perimeter)
+        self.B, self.d_g, self.U_g, self.U_x, self.U, self.H_pi, self.H_pe = (
+            _suspended_floor(
+                self.area,
+                self.perimeter,
+                self.ground.conductivity,
+                self.ground.sigma,
+                self.d_w_e,
+                self.U_f_sus,
+                self.R_g,
+                self.h,
+                self.U_w,
+                self.epsilon,
+                self.v,
+                self.f_w,
+            )
+        )
+        self.H_g = f.H_g1(A=self.area, U=self.U, P=self.perimeter, Psi_wf=self.Psi_wf)
 
 
 @dataclass
@@ -54,11 +200,44 @@ class HeatedBasement:
     area: float
     perimeter: float
     ground: Ground
+    d_w_e: float = 0.3  # Thickness of the external walls [m]
+    z: float = 2.0  # Depth of the basement floor below the ground [m]
+    R_f_b: float = 0.0  # Thermal resistance of the basement floor [m2K/W]
+    R_w_b: float = 0.0  # Thermal resistance of the basement walls [m2K/W]
+    Psi_wf: float = 0.0  # Linear thermal transmittance of the wall/floor junction
 
     B: float = field(init=False)
+    d_f: float = field(init=False)
+    d_w_b: float = field(init=False)
+    U_fg_b: float = field(init=False)  # Thermal transmittance of the basement floor
+    U_wg_b: float = field(init=False)  # Thermal transmittance of the basement walls
+    U: float = field(init=False)  # Effective thermal transmittance of the basement
+    H_g: float = field(init=False)  # Steady state ground heat transfer coefficient
+    H_pi: float = field(init=False)  # Internal periodic heat transfer coefficient
+    H_pe: float = field(init=False)  # External periodic heat transfer coefficient
 
     def __post_init__(self) -> None:
-        self.B: float = f.B(A=self.area, P=self.perimeter)
+        (
+            self.B,
+            self.d_f,
+            self.d_w_b,
+            self.U_fg_b,
+            self.U_wg_b,
+            self.U,
+            self.H_g,
+            self.H_pi,
+            self.H_pe,
+        ) = _heated_basement(
+            self.area,
+            self.perimeter,
+            self.ground.conductivity,
+            self.ground.sigma,
+            self.d_w_e,
+            self.z,
+            self.R_f_b,
+            self.R_w_b,
+            self.Psi_wf,
+        )
 
 
 @dataclass
@@ -67,8 +246,306 @@ class UnheatedBasement:
     area: float
     perimeter: float
     ground: Ground
+    d_w_e: float = 0.3  # Thickness of the external walls [m]
+    z: float = 2.0  # Depth of the basement floor below the ground [m]
+    R_f_b: float = 0.0  # Thermal resistance of the basement floor [m2K/W]
+    R_w_b: float = 0.0  # Thermal resistance of the basement walls [m2K/W]
+    U_f_sus: float = (
+        0.3  # Thermal transmittance of the floor above the basement [W/m2K]
+    )
+    h: float = 0.3  # Height of the basement walls above the ground [m]
+    U_w: float = 1.5  # Thermal transmittance of the walls above the ground [W/m2K]
+    n: float = 0.3  # Air change rate of the basement [1/h]
+    V: float = 200.0  # Air volume of the basement [m3]
+    Psi_wf: float = 0.0  # Linear thermal transmittance of the wall/floor junction
 
     B: float = field(init=False)
+    d_f: float = field(init=False)
+    d_w_b: float = field(init=False)
+    U_fg_b: float = field(init=False)  # Thermal transmittance of the basement floor
+    U_wg_b: float = field(init=False)  # Thermal transmittance of the basement walls
+    U: float = field(init=False)  # Thermal transmittance of the floor
+    H_g: float = field(init=False)  # Steady state ground heat transfer coefficient
+    H_pi: float = field(init=False)  # Internal periodic heat transfer coefficient
+    H_pe: float = field(init=False)  # External periodic heat transfer coefficient
+
+    def __post_init__(self) -> None:
+        (
+            self.B,
+            self.d_f,
+            self.d_w_b,
+            self.U_fg_b,
+            self.U_wg_b,
+            self.U,
+            self.H_pi,
+            self.H_pe,
+        ) = _unheated_basement(
+            self.area,
+            self.perimeter,
+            self.ground.conductivity,
+            self.ground.sigma,
+            self.d_w_e,
+            self.z,
+            self.R_f_b,
+            self.R_w_b,
+            self.U_f_sus,
+            self.h,
+            self.U_w,
+            self.n,
+            self.V,
+        )
+        self.H_g = f.H_g1(A=self.area, U=self.U, P=self.perimeter, Psi_wf=self.Psi_wf)
+
+
+@dataclass
+class SuspendedFloorBatch:
+    """Suspended floors evaluated at once, the fields of SuspendedFloor
+    as arrays broadcasting against each other."""
+
+    area: ArrayLike
+    perimeter: ArrayLike
+    conductivity: ArrayLike  # Thermal conductivity of the ground [W/mK]
+    heat_capacity: ArrayLike = 2.0e6  # Volumetric heat capacity of the ground [J/m3K]
+    d_w_e: ArrayLike = 0.3
+    U_f_sus: ArrayLike = 0.3
+    R_g: ArrayLike = 0.0
+    h: ArrayLike = 0.3
+    U_w: ArrayLike = 1.5
+    epsilon: ArrayLike = 0.003
+    v: ArrayLike = 4.0
+    f_w: ArrayLike = 0.05
+    Psi_wf: ArrayLike = 0.0
+
+    sigma: np.ndarray = field(init=False)
+    B: np.ndarray = field(init=False)
+    d_g: np.ndarray = field(init=False)
+    U_g: np.ndarray = field(init=False)
+    U_x: np.ndarray = field(init=False)
+    U: np.ndarray = field(init=False)
+    H_g: np.ndarray = field(init=False)
+    H_pi: np.ndarray = field(init=False)
+    H_pe: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        A, P, k_g = _arrays(self.area, self.perimeter, self.conductivity)
+        self.sigma = f.sigma1(k_g=k_g, rho=self.heat_capacity, c=1)
+        self.B, self.d_g, self.U_g, self.U_x, self.U, self.H_pi, self.H_pe = (
+            _suspended_floor(
+                A,
+                P,
+                k_g,
+                self.sigma,
+                self.d_w_e,
+                self.U_f_sus,
+                self.R_g,
+                self.h,
+                self.U_w,
+                self.epsilon,
+                self.v,
+                self.f_w,
+            )
+        )
+        self.H_g = f.H_g1(A=A, U=self.U, P=P, Psi_wf=self.Psi_wf)
+
+    def __len__(self) -> int:
+        return np.size(self.U)
+
+
+@dataclass
+class HeatedBasementBatch:
+    """Heated basements evaluated at once, the fields of HeatedBasement
+    as arrays broadcasting against each other."""
+
+    area: ArrayLike
+    perimeter: ArrayLike
+    conductivity: ArrayLike  # Thermal conductivity of the ground [W/mK]
+    heat_capacity: ArrayLike = 2.0e6  # Volumetric heat capacity of the ground [J/m3K]
+    d_w_e: ArrayLike = 0.3
+    z: ArrayLike = 2.0
+    R_f_b: ArrayLike = 0.0
+    R_w_b: ArrayLike = 0.0
+    Psi_wf: ArrayLike = 0.0
+
+    sigma: np.ndarray = field(init=False)
+    B: np.ndarray = field(init=False)
+    d_f: np.ndarray = field(init=False)
+    d_w_b: np.ndarray = field(init=False)
+    U_fg_b: np.ndarray = field(init=False)
+    U_wg_b: np.ndarray = field(init=False)
+    U: np.ndarray = field(init=False)
+    H_g: np.ndarray = field(init=False)
+    H_pi: np.ndarray = field(init=False)
+    H_pe: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        A, P, k_g = _arrays(self.area, self.perimeter, self.conductivity)
+        self.sigma = f.sigma1(k_g=k_g, rho=self.heat_capacity, c=1)
+        (
+            self.B,
+            self.d_f,
+            self.d_w_b,
+            self.U_fg_b,
+            self.U_wg_b,
+            self.U,
+            self.H_g,
+            self.H_pi,
+            self.H_pe,
+        ) = _heated_basement(
+            A,
+            P,
+            k_g,
+            self.sigma,
+            self.d_w_e,
+            self.z,
+            self.R_f_b,
+            self.R_w_b,
+            self.Psi_wf,
+        )
+
+    def __len__(self) -> int:
+        return np.size(self.U)
+
+
+@dataclass
+class UnheatedBasementBatch:
+    """Unheated basements evaluated at once, the fields of UnheatedBasement
+    as arrays broadcasting against each other."""
+
+    area: ArrayLike
+    perimeter: ArrayLike
+    conductivity: ArrayLike  # Thermal conductivity of the ground [W/mK]
+    heat_capacity: ArrayLike = 2.0e6  # Volumetric heat capacity of the ground [J/m3K]
+    d_w_e: ArrayLike = 0.3
+    z: ArrayLike = 2.0
+    R_f_b: ArrayLike = 0.0
+    R_w_b: ArrayLike = 0.0
+    U_f_sus: ArrayLike = 0.3
+    h: ArrayLike = 0.3
+    U_w: ArrayLike = 1.5
+    n: ArrayLike = 0.3
+    V: ArrayLike = 200.0
+    Psi_wf: ArrayLike = 0.0
+
+    sigma: np.ndarray = field(init=False)
+    B: np.ndarray = field(init=False)
+    d_f: np.ndarray = field(init=False)
+    d_w_b: np.ndarray = field(init=False)
+    U_fg_b: np.ndarray = field(init=False)
+    U_wg_b: np.ndarray = field(init=False)
+    U: np.ndarray = field(init=False)
+    H_g: np.ndarray = field(init=False)
+    H_pi: np.ndarray = field(init=False)
+    H_pe: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        A, P, k_g = _arrays(self.area, self.perimeter, self.conductivity)
+        self.sigma = f.sigma1(k_g=k_g, rho=self.heat_capacity, c=1)
+        (
+            self.B,
+            self.d_f,
+            self.d_w_b,
+            self.U_fg_b,
+            self.U_wg_b,
+            self.U,
+            self.H_pi,
+            self.H_pe,
+        ) = _unheated_basement(
+            A,
+            P,
+            k_g,
+            self.sigma,
+            self.d_w_e,
+            self.z,
+            self.R_f_b,
+            self.R_w_b,
+            self.U_f_sus,
+            self.h,
+            self.U_w,
+            self.n,
+            self.V,
+        )
+        self.H_g = f.H_g1(A=A, U=self.U, P=P, Psi_wf=self.Psi_wf)
+
+    def __len__(self) -> int:
+        return np.size(self.U)
+
+
+def _arrays(*values):
+    return (np.asarray(x, dtype=float) for x in values)
+
+
+@dataclass
+class MonthlyGroundHeatFlow:
+    """Monthly heat flow through the ground (Annex C) of many floors,
+    monthly results are arrays of shape (floors, 12). Floor and climate
+    inputs are scalars or arrays over the floors."""
+
+    H_g: ArrayLike  # Steady state ground heat transfer coefficient [W/K]
+    H_pi: ArrayLike  # Internal periodic heat transfer coefficient [W/K]
+    H_pe: ArrayLike  # External periodic heat transfer coefficient [W/K]
+    t_int_ann_ave: ArrayLike = 20.0  # Annual average internal temperature [*C]
+    t_int_amp: ArrayLike = 0.0  # Amplitude of the monthly internal temperature [K]
+    t_e_ann_ave: ArrayLike = 8.0  # Annual average external temperature [*C]
+    t_e_amp: ArrayLike = 10.0  # Amplitude of the monthly external temperature [K]
+    tau: ArrayLike = 1  # Month of the minimum external temperature
+    alfa: ArrayLike = 0  # Phase shift of the internal temperature [months]
+    beta: ArrayLike = 1  # Phase shift of the external temperature [months]
+    heating_months: ArrayLike = 7  # Length of the heating season [months]
+    cooling_months: ArrayLike = 5  # Length of the cooling season [months]
+
+    t_int_m: np.ndarray = field(init=False)  # Monthly internal temperature [*C]
+    t_e_m: np.ndarray = field(init=False)  # Monthly external temperature [*C]
+    Phi_m: np.ndarray = field(init=False)  # Monthly heat flow rate [W]
+    H_g_m: np.ndarray = field(init=False)  # Monthly heat transfer coefficient [W/K]
+    Phi_ann: np.ndarray = field(init=False)  # Annual average heat flow rate [W]
+    Phi_max: np.ndarray = field(init=False)  # Maximum monthly heat flow rate [W]
+    Phi_s_h: np.ndarray = field(init=False)  # Heating season heat flow rate [W]
+    Phi_s_c: np.ndarray = field(init=False)  # Cooling season heat flow rate [W]
+
+    @classmethod
+    def from_floors(cls, floors, **climate):
+        """Monthly heat flow of floors or batches of floors providing
+        H_g, H_pi and H_pe, e.g. an estate of mixed foundation types."""
+        return cls(
+            *(
+                np.concatenate([np.ravel(getattr(floor, name)) for floor in floors])
+                for name in ("H_g", "H_pi", "H_pe")
+            ),
+            **climate,
+        )
 
     def __post_init__(self) -> None:
-        self.B: float = f.B(A=self.area, P=self.perimeter)
+        H_g, H_pi, H_pe, t_i, A_i, t_e, A_e, tau, alfa, beta = (
+            np.asarray(x, dtype=float)[..., None]
+            for x in (
+                self.H_g,
+                self.H_pi,
+                self.H_pe,
+                self.t_int_ann_ave,
+                self.t_int_amp,
+                self.t_e_ann_ave,
+                self.t_e_amp,
+                self.tau,
+                self.alfa,
+                self.beta,
+            )
+        )
+        self.t_int_m = f.t_int_m(t_i, A_i, MONTHS, tau)
+        self.t_e_m = f.t_e_m(t_e, A_e, MONTHS, tau)
+        self.Phi_m = f.Phi_m1(
+            H_g, H_pi, H_pe, t_i, A_i, t_e, A_e, alfa, beta, tau, MONTHS
+        )
+        self.H_g_m = f.H_g_ann_m(self.Phi_m, t_i, t_e)
+
+        # annual and seasonal values of the floors
+        H_g, H_pi, H_pe, t_i, A_i, t_e, A_e = (
+            x[..., 0] for x in (H_g, H_pi, H_pe, t_i, A_i, t_e, A_e)
+        )
+        self.Phi_ann = f.Phi_ann(H_g, t_i, t_e)
+        self.Phi_max = f.Phi_max(H_g, H_pe, t_i, t_e, A_e)
+        self.Phi_s_h = f.Phi_s_h(
+            H_g, H_pi, H_pe, t_i, A_i, t_e, A_e, f.gamma(self.heating_months)
+        )
+        self.Phi_s_c = f.Phi_s_c(
+            H_g, H_pi, H_pe, t_i, A_i, t_e, A_e, f.gamma(self.cooling_months)
+        )
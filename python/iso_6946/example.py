@@ -9,7 +9,7 @@ InternalFloor = Construction(name="InternalFloor", materials=[Wood, Concrete])
 boundary = "ext"
 direction = "horizontal"
 
-#R_s_c = R_s_c(boundary=boundary, direction=direction)
+# R_s_c = R_s_c(boundary=boundary, direction=direction)
 
 U_EW = Transmittance(
     name="ExternalWall", construction=ExternalWall, direction="horizontal"
@@ -20,4 +20,69 @@ U_IF = Transmittance(
 
 print("External Wall")
 print("R:", ExternalWall.R)
-print("R_se:", U_EW.R_se)
\ No newline at end of file
+print("R_se:", U_EW.R_se)
+# the same constructions stored column-wise, computed in one call
+constructions = ConstructionTable.from_constructions(
+    [ExternalWall, InternalFloor], direction=["horizontal", "upwards"]
+)
+print("Constructions")
+print("R:", constructions.R)
+print("U:", constructions.U)
+
+# timber frame wall, plasterboard / studs or insulation / OSB, for three framing factors
+framing_factor = [0.1, 0.15, 0.2]
+TimberFrame = InhomogeneousComponent(
+    thickness=[0.0125, 0.15, 0.012],
+    conductivity=[[0.25, 0.13, 0.13], [0.25, 0.035, 0.13]],
+    f_q=[[x, 1 - x] for x in framing_factor],
+    R_si=0.13,
+    R_se=0.04,
+)
+print("Timber frame")
+print("R_tot:", TimberFrame.R_tot)
+print("e:", TimberFrame.e)
+
+# external surface resistance over a range of mean temperatures and wind speeds
+R_se = surface_resistance(
+    "ext", "horizontal", 0.9, mean_temperature=[[0], [10]], wind_speed=[1, 4, 8]
+)
+print("R_se:", R_se.round(4))
+print(surface_resistance.cache_info())
+
+# constructions referenced by name from the catalogue of materials and constructions
+from library import Library
+
+library = Library.from_csv("materials.csv", "constructions.csv")
+walls = library.constructions_in("external wall")
+print("External walls:", library.construction_name[walls])
+print("U:", library.table(walls, direction="horizontal").U.round(3))
+
+# ETICS wall with air voids and anchors through the insulation (Annex F)
+ETICS = Construction(
+    "ETICS",
+    [
+        Material("Plaster", 0.01, 0.8),
+        Material("Mineral wool", 0.15, 0.035),
+        Material("Concrete", 0.2, 2.3),
+    ],
+)
+Anchored = Transmittance(
+    "ETICS", ETICS, "horizontal", corrected_layer=1, air_voids=1, n_f=6, A_f=5e-5
+)
+print("U:", Anchored.U, "deltaU:", Anchored.deltaU, "U_c:", Anchored.U_c)
+
+# the same corrections for a range of fixing densities
+walls = ConstructionTable.from_constructions([ETICS], ["horizontal"])
+Fixings = TransmittanceCorrections(
+    walls, layer=1, air_voids=1, n_f=[[2], [4], [6], [8]], A_f=5e-5
+)
+print("U_c:", Fixings.U_c.ravel().round(3))
+
+# unventilated cavities of three thicknesses with a low emissivity foil, by direction
+Cavities = AirCavity(
+    thickness=[0.01, 0.025, 0.05],
+    direction=[["upwards"], ["horizontal"], ["downwards"]],
+    epsilon_1=0.05,
+)
+print("R air layer:", Cavities.R.round(3))
+print("R Table 8:", Cavities.R_table.round(3))
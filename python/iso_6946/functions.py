@@ -1,6 +1,8 @@
 from math import log
+import numpy as np
 from numpy import iterable
 from scipy.interpolate import CubicSpline
+from utils.tables import tables
 
 
 def U1(R_tot):
@@ -57,7 +59,7 @@ def k_eq_j(k_qj, f_q):
 def e(R_tot_upper, R_tot_lower):
     """Function 10 - Maximum relative error."""
     R_tot = R_tot2(R_tot_upper, R_tot_lower)
-    return (R_tot_upper + R_tot_lower) * 50 / R_tot
+    return (R_tot_upper - R_tot_lower) * 50 / R_tot
 
 
 def R_s_c(boundary, direction):
@@ -69,26 +71,35 @@ def R_s_c(boundary, direction):
         return 0.04
 
 
+@tables.register("iso_6946.R_unve_air")
+def _R_unve_air_table():
+    x_thickness = [0, 5, 7, 10, 15, 25, 50, 100, 300]
+    # columns by direction code - upwards, horizontal, downwards
+    y_R = [
+        [0.00, 0.00, 0.00],
+        [0.11, 0.11, 0.11],
+        [0.13, 0.13, 0.13],
+        [0.15, 0.15, 0.15],
+        [0.16, 0.17, 0.17],
+        [0.16, 0.18, 0.19],
+        [0.16, 0.18, 0.21],
+        [0.16, 0.18, 0.22],
+        [0.16, 0.18, 0.23],
+    ]
+    return CubicSpline(x_thickness, y_R)
+
+
 def R_unve_air(thickness, direction):
     """Table 8 - Thermal resistance of unventilated air layers with high
-    emissivity surfaces."""
-    if direction.lower() == "upwards":
-        x_thickness = [0, 5, 7, 10, 15, 25, 50, 100, 300]
-        y_R = [0.00, 0.11, 0.13, 0.15, 0.16, 0.16, 0.16, 0.16, 0.16]
-        cs = CubicSpline(x_thickness, y_R)
-        return cs(thickness)
-
-    if direction.lower() == "horizontal":
-        x_thickness = [0, 5, 7, 10, 15, 25, 50, 100, 300]
-        y_R = [0.00, 0.11, 0.13, 0.15, 0.17, 0.18, 0.18, 0.18, 0.18]
-        cs = CubicSpline(x_thickness, y_R)
-        return cs(thickness)
-
-    if direction.lower() == "downwards":
-        x_thickness = [0, 5, 7, 10, 15, 25, 50, 100, 300]
-        y_R = [0.00, 0.11, 0.13, 0.15, 0.17, 0.19, 0.21, 0.22, 0.23]
-        cs = CubicSpline(x_thickness, y_R)
-        return cs(thickness)
+    emissivity surfaces. Arguments:
+    thickness - thickness of the air layer [mm]
+    direction - heat flow direction by name or by code (0 upwards,
+    1 horizontal, 2 downwards), broadcasting against the thickness
+    """
+    R = tables.get("iso_6946.R_unve_air")(thickness)
+    if isinstance(direction, str):
+        return R[..., ("upwards", "horizontal", "downwards").index(direction.lower())]
+    return np.choose(direction, np.moveaxis(R, -1, 0))
 
 
 def R_tot3(A_ve, R_tot_nve, R_tot_ve):
@@ -124,7 +135,7 @@ def h_r0(T_mn):
     Arguments:
     T_mn - mean temperature of the surface and of its surroundings [K]
     """
-    return 4 * 5.67 * 10e-8 * T_mn**3
+    return 4 * 5.67e-8 * T_mn**3
 
 
 def h_ci(direction):
@@ -154,16 +165,21 @@ def R_a1(h_a, h_r):
 
 
 def h_a(deltaT, d, alfa):
-    """Function D.2 - Conduction/convection coefficient."""
-    if deltaT <= 5:
-        # Table D.1
-        h_a_90 = 1.25
-        h_a_0 = 1.95
-    else:
-        # Table D.2
-        h_a_90 = 0.73 * deltaT ** (1 / 3)
-        h_a_0 = 1.14 * deltaT ** (1 / 3)
-    return max(h_a_90 + (h_a_90 - h_a_0) * (alfa - 90) / 90, 0.025 / d)
+    """Function D.2 - Conduction/convection coefficient, alfa is the angle
+    of the heat flow from upwards (0) to horizontal (90) [deg]."""
+    deltaT = np.asarray(deltaT)
+    # Table D.1 up to 5 K, Table D.2 above
+    h_a_90 = np.where(deltaT <= 5, 1.25, 0.73 * deltaT ** (1 / 3))
+    h_a_0 = np.where(deltaT <= 5, 1.95, 1.14 * deltaT ** (1 / 3))
+    return np.maximum(h_a_90 + (h_a_90 - h_a_0) * (alfa - 90) / 90, 0.025 / d)
+
+
+def h_a_down(deltaT, d):
+    """Tables D.1 and D.2 - Conduction/convection coefficient
+    for downward heat flow."""
+    deltaT = np.asarray(deltaT)
+    h_a = np.where(deltaT <= 5, 0.12, 0.09 * deltaT**0.187) * d**-0.44
+    return np.maximum(h_a, 0.025 / d)
 
 
 def h_r1(E, h_r0):
@@ -185,8 +201,7 @@ def h_r2(h_r0, epsilon_1, epsilon_2, d, b):
     """Function D.6 -
     Radiative coefficient of the small or divided airspaces."""
     return h_r0 / (
-        (1 / epsilon_1 + 1 / epsilon_2 - 2)
-        + 2 / (1 - d / b + (1 + d**2 / b**2) ** 0.5)
+        (1 / epsilon_1 + 1 / epsilon_2 - 2) + 2 / (1 - d / b + (1 + d**2 / b**2) ** 0.5)
     )
 
 
@@ -256,6 +271,11 @@ def deltaU_g(deltaU_bis, R_1, R_tot):
     return deltaU_bis * (R_1 / R_tot) ** 2
 
 
+def deltaU_bis(level):
+    """Table F.1 - Correction for air voids by level 0, 1 or 2."""
+    return np.array([0.0, 0.01, 0.04])[level]
+
+
 def deltaU_f1(n_f, X):
     """Function F.4 - Correction for mechanical fasteners, X from ISO 10211."""
     return n_f * X
@@ -265,11 +285,13 @@ def deltaU_f2(k_f, A_f, n_f, R_1, R_tot, d_1, d_0=0):
     """
     Function F.5 -
     Approximate procedure for correction for mechanical fasteners.
+    Arguments:
+    d_1 - thickness of the insulation layer containing the fastener [m]
+    d_0 - length of a recessed fastener within that layer,
+          0 when the fastener penetrates the layer [m]
     """
-    if d_0 == 0:
-        alfa = 0.8
-    else:
-        alfa = 0.8 * d_1 / d_0
+    d_0 = np.asarray(d_0, dtype=float)
+    alfa = np.where(d_0 == 0, 0.8, 0.8 * d_0 / d_1)
     return alfa * k_f * A_f * n_f / d_1 * (R_1 / R_tot) ** 2
 
 
@@ -0,0 +1,229 @@
+import csv
+import sqlite3
+import numpy as np
+from dataclasses import dataclass, field
+from iso_6946.methodology import Material, Construction, ConstructionTable
+
+
+def _group(keys):
+    """Rows grouped by key in order of first appearance,
+    returns the keys, the row order and the offsets of the groups."""
+    names, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    rank = np.argsort(np.argsort(first))
+    order = np.argsort(rank[inverse], kind="stable")
+    counts = np.bincount(rank[inverse], minlength=len(names))
+    return names[np.argsort(rank)], order, np.concatenate([[0], np.cumsum(counts)])
+
+
+@dataclass
+class Library:
+    """Catalogue of materials and constructions stored in arrays. Layers
+    of construction i are rows offsets[i]:offsets[i + 1] of the layer
+    table, the first layer is external."""
+
+    material_name: np.ndarray
+    material_category: np.ndarray
+    conductivity: np.ndarray  # [W/mK]
+    surface_emissivity: np.ndarray
+    construction_name: np.ndarray
+    construction_category: np.ndarray
+    offsets: np.ndarray
+    layer_material: np.ndarray  # Material id of every layer
+    thickness: np.ndarray  # Thickness of every layer [m]
+
+    layer_R: np.ndarray = field(init=False)  # Thermal resistance of every layer
+    R: np.ndarray = field(init=False)  # Thermal resistance of every construction
+
+    @classmethod
+    def from_rows(cls, materials, layers):
+        """Library from rows of materials (name, category, conductivity,
+        surface_emissivity) and of layers (construction, category, material,
+        thickness) listed from the external side."""
+        name, category, conductivity, surface_emissivity = (
+            np.array(x) for x in zip(*materials)
+        )
+        construction, construction_category, material, thickness = (
+            np.array(x) for x in zip(*layers)
+        )
+        construction_name, order, offsets = _group(construction)
+        material_order = np.argsort(name)
+        return cls(
+            material_name=name,
+            material_category=category,
+            conductivity=conductivity.astype(float),
+            surface_emissivity=surface_emissivity.astype(float),
+            construction_name=construction_name,
+            construction_category=construction_category[order[offsets[:-1]]],
+            offsets=offsets,
+            layer_material=cls._ids(
+                material[order], name[material_order], material_order, "material"
+            ),
+            thickness=thickness[order].astype(float),
+        )
+
+    @classmethod
+    def from_csv(cls, materials, constructions):
+        """Library from a materials file with the columns name, category,
+        conductivity, surface_emissivity and a constructions file with one
+        row per layer and the columns construction, category, material,
+        thickness."""
+        with open(materials, newline="") as file:
+            material_rows = list(csv.reader(file))[1:]
+        with open(constructions, newline="") as file:
+            layer_rows = list(csv.reader(file))[1:]
+        return cls.from_rows(material_rows, layer_rows)
+
+    @classmethod
+    def from_sqlite(cls, path):
+        """Library from the tables materials and layers of an SQLite file,
+        with the columns of from_csv and the position of every layer."""
+        with sqlite3.connect(path) as connection:
+            material_rows = connection.execute(
+                "SELECT name, category, conductivity, surface_emissivity"
+                " FROM materials"
+            ).fetchall()
+            layer_rows = connection.execute(
+                "SELECT construction, category, material, thickness"
+                " FROM layers ORDER BY construction, position"
+            ).fetchall()
+        return cls.from_rows(material_rows, layer_rows)
+
+    def to_sqlite(self, path):
+        """Write the library in the format read by from_sqlite."""
+        construction = np.repeat(
+            np.arange(len(self.offsets) - 1), np.diff(self.offsets)
+        )
+        position = np.arange(len(construction)) - self.offsets[construction]
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE materials"
+                " (name TEXT PRIMARY KEY, category TEXT,"
+                " conductivity REAL, surface_emissivity REAL)"
+            )
+            connection.execute(
+                "CREATE TABLE layers (construction TEXT, category TEXT,"
+                " material TEXT, thickness REAL, position INTEGER)"
+            )
+            connection.executemany(
+                "INSERT INTO materials VALUES (?, ?, ?, ?)",
+                zip(
+                    self.material_name.tolist(),
+                    self.material_category.tolist(),
+                    self.conductivity.tolist(),
+                    self.surface_emissivity.tolist(),
+                ),
+            )
+            connection.executemany(
+                "INSERT INTO layers VALUES (?, ?, ?, ?, ?)",
+                zip(
+                    self.construction_name[construction].tolist(),
+                    self.construction_category[construction].tolist(),
+                    self.material_name[self.layer_material].tolist(),
+                    self.thickness.tolist(),
+                    position.tolist(),
+                ),
+            )
+
+    @staticmethod
+    def _index(names):
+        index = {name: i for i, name in enumerate(names.tolist())}
+        if len(index) != len(names):
+            raise ValueError("Names in the library are not unique.")
+        return index
+
+    @staticmethod
+    def _categories(categories):
+        names, inverse = np.unique(categories, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        ids = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
+        return dict(zip(names.tolist(), ids))
+
+    @staticmethod
+    def _ids(names, sorted_names, order, kind):
+        names = np.asarray(names)
+        i = np.minimum(np.searchsorted(sorted_names, names), len(sorted_names) - 1)
+        unknown = sorted_names[i] != names
+        if np.any(unknown):
+            raise KeyError(f"Unknown {kind}: {np.ravel(names[unknown])[0]}")
+        return order[i]
+
+    def material_id(self, name):
+        return self.material_index[name]
+
+    def construction_id(self, name):
+        return self.construction_index[name]
+
+    def material_ids(self, names):
+        """Ids of an array of material names."""
+        order = self._material_order
+        return self._ids(names, self.material_name[order], order, "material")
+
+    def construction_ids(self, names):
+        """Ids of an array of construction names."""
+        order = self._construction_order
+        return self._ids(names, self.construction_name[order], order, "construction")
+
+    def materials_in(self, category):
+        return self.material_categories.get(category, np.empty(0, dtype=np.int64))
+
+    def constructions_in(self, category):
+        return self.construction_categories.get(category, np.empty(0, dtype=np.int64))
+
+    def layers(self, ids):
+        """Offsets and layer table rows of the constructions of the ids."""
+        ids = np.asarray(ids, dtype=np.int64)
+        counts = np.diff(self.offsets)[ids]
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        rows = np.repeat(self.offsets[ids] - offsets[:-1], counts)
+        return offsets, rows + np.arange(offsets[-1])
+
+    def table(self, ids, direction, **kwargs):
+        """ConstructionTable of the constructions of the ids, which may repeat."""
+        offsets, rows = self.layers(ids)
+        material = self.layer_material[rows]
+        return ConstructionTable(
+            offsets=offsets,
+            thickness=self.thickness[rows],
+            conductivity=self.conductivity[material],
+            surface_emissivity=self.surface_emissivity[material],
+            direction=direction,
+            names=self.construction_name[ids],
+            **kwargs,
+        )
+
+    def material(self, name, thickness):
+        i = self.material_id(name)
+        return Material(
+            name=name,
+            thickness=thickness,
+            conductivity=float(self.conductivity[i]),
+            surface_emissivity=float(self.surface_emissivity[i]),
+        )
+
+    def construction(self, name):
+        i = self.construction_id(name)
+        rows = range(self.offsets[i], self.offsets[i + 1])
+        materials = [
+            self.material(
+                str(self.material_name[self.layer_material[j]]),
+                float(self.thickness[j]),
+            )
+            for j in rows
+        ]
+        return Construction(name=name, materials=materials)
+
+    def __post_init__(self) -> None:
+        self.material_index = self._index(self.material_name)
+        self.construction_index = self._index(self.construction_name)
+        self._material_order = np.argsort(self.material_name)
+        self._construction_order = np.argsort(self.construction_name)
+        self.material_categories = self._categories(self.material_category)
+        self.construction_categories = self._categories(self.construction_category)
+
+        self.layer_R = self.thickness / self.conductivity[self.layer_material]
+        construction = np.repeat(
+            np.arange(len(self.offsets) - 1), np.diff(self.offsets)
+        )
+        self.R = np.bincount(
+            construction, weights=self.layer_R, minlength=len(self.offsets) - 1
+        )
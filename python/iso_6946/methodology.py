@@ -1,10 +1,16 @@
 import iso_6946.functions as f
+import numpy as np
 from dataclasses import dataclass, field
+from functools import lru_cache
 from numpy import iterable
+from numpy.typing import ArrayLike
+from utils.dependency import Node
+
+DIRECTIONS = ("upwards", "horizontal", "downwards")  # Heat flow directions by code
 
 
 @dataclass
-class Material:
+class Material(Node):
     name: str
     thickness: float
     conductivity: float
@@ -16,18 +22,66 @@ class Material:
 
 
 @dataclass
-class Construction:
+class Construction(Node):
     name: str
     materials: list[Material]
     R: float = field(init=False)
 
     def __post_init__(self) -> None:
         if iterable(self.materials):
+            self.depends_on(*self.materials)
             self.R = sum([material.R for material in self.materials])
         else:
+            self.depends_on(self.materials)
             self.R = self.materials.R
 
 
+SCALARS = (int, float, np.number)
+
+
+@lru_cache(maxsize=1024)
+def _surface_resistance(boundary, direction, epsilon, T_mn, v):
+    if boundary == "in":
+        h_c = f.h_ci(direction)
+    elif boundary == "ext":
+        h_c = f.h_ce(v)
+    else:
+        raise ValueError(f"Unknown boundary: {boundary}")
+
+    h_r0 = f.h_r0(T_mn=T_mn + 273.15)
+    h_r = f.h_r(epsilon=epsilon, h_r0=h_r0)
+    return f.R_s(h_c, h_r)
+
+
+def surface_resistance(
+    boundary, direction, surface_emissivity=0.9, mean_temperature=10, wind_speed=4
+):
+    """Surface resistance memoized in a bounded cache shared by all callers,
+    the mean temperature and the wind speed may be arrays."""
+    if isinstance(mean_temperature, SCALARS) and isinstance(wind_speed, SCALARS):
+        return _surface_resistance(
+            boundary, direction, surface_emissivity, mean_temperature, wind_speed
+        )
+
+    T_mn, v = np.broadcast_arrays(
+        np.asarray(mean_temperature, dtype=float), np.asarray(wind_speed, dtype=float)
+    )
+    points = np.stack([T_mn.ravel(), v.ravel()], axis=-1)
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    R_s = np.array(
+        [
+            _surface_resistance(boundary, direction, surface_emissivity, T, w)
+            for T, w in unique.tolist()
+        ]
+    )
+    return R_s[inverse.ravel()].reshape(T_mn.shape)
+
+
+# hits, misses and size of the shared cache
+surface_resistance.cache_info = _surface_resistance.cache_info
+surface_resistance.cache_clear = _surface_resistance.cache_clear
+
+
 @dataclass
 class SurfaceResistance:
     boundary: str
@@ -38,36 +92,295 @@ class SurfaceResistance:
     R_s: float = field(init=False)
 
     def __post_init__(self) -> None:
-        if self.boundary == "in":
-            h_c = f.h_ci(self.direction)
-        elif self.boundary == "ext":
-            h_c = f.h_ce(self.wind_speed)
-
-        h_r0 = f.h_r0(T_mn=self.mean_temperature)
-        h_r = f.h_r(epsilon=self.material.surface_emissivity, h_r0=h_r0)
-
-        self.R_s = f.R_s(h_c, h_r)
+        self.R_s = surface_resistance(
+            self.boundary,
+            self.direction,
+            self.material.surface_emissivity,
+            self.mean_temperature,
+            self.wind_speed,
+        )
 
 
 @dataclass
-class Transmittance:
+class Transmittance(Node):
     name: str
     construction: Construction
     direction: str
+
+    # Annex F corrections of the layer with air voids, fasteners
+    # or the insulation above the membrane of an inverted roof
+    corrected_layer: int = None  # Index of the layer in the construction
+    air_voids: int = 0  # Level of air voids, Table F.1
+    n_f: float = 0  # Number of fasteners per m2
+    k_f: float = 50  # Thermal conductivity of the fasteners [W/mK]
+    A_f: float = 0  # Cross-sectional area of one fastener [m2]
+    d_0: float = 0  # Length of recessed fasteners in the layer, 0 if penetrating [m]
+    p: float = 0  # Mean rainfall during the heating season [mm/day]
+    f_r: float = 0.75  # Drainage factor of the inverted roof
+    x_r: float = 0.04  # Factor for increased heat loss [W*day/m2*K*mm]
+
     R_n: float = field(init=False)
     R_si: float = field(init=False)
     R_se: float = field(init=False)
     R_tot: float = field(init=False)
     U: float = field(init=False)
+    deltaU_g: float = field(init=False)
+    deltaU_f: float = field(init=False)
+    deltaU_r: float = field(init=False)
+    deltaU: float = field(init=False)
+    U_c: float = field(init=False)  # Corrected thermal transmittance
 
     def __post_init__(self) -> None:
+        self.depends_on(self.construction)
         self.R_n = self.construction.R
 
         # convention - first material is external
         external_material = self.construction.materials[0]
         internal_material = self.construction.materials[-1]
 
-        self.R_si = SurfaceResistance("in", self.direction, internal_material).R_s
-        self.R_se = SurfaceResistance("ext", self.direction, external_material).R_s
+        self.R_si = surface_resistance(
+            "in", self.direction, internal_material.surface_emissivity
+        )
+        self.R_se = surface_resistance(
+            "ext", self.direction, external_material.surface_emissivity
+        )
         self.R_tot = f.R_tot1(self.R_si, self.R_n, self.R_se)
         self.U = f.U1(self.R_tot)
+
+        self.deltaU_g = self.deltaU_f = self.deltaU_r = 0.0
+        if self.corrected_layer is not None:
+            layer = self.construction.materials[self.corrected_layer]
+            R_1, d_1 = layer.R, layer.thickness
+            self.deltaU_g = f.deltaU_g(f.deltaU_bis(self.air_voids), R_1, self.R_tot)
+            self.deltaU_f = float(
+                f.deltaU_f2(
+                    self.k_f, self.A_f, self.n_f, R_1, self.R_tot, d_1, self.d_0
+                )
+            )
+            self.deltaU_r = f.deltaU_r(self.p, self.f_r, self.x_r, R_1, self.R_tot)
+        self.deltaU = f.deltaU(self.deltaU_g, self.deltaU_f, self.deltaU_r)
+        self.U_c = f.U_c(self.U, self.deltaU)
+
+
+def direction_code(direction):
+    """Integer codes of heat flow directions given by name or by code."""
+    direction = np.asarray(direction)
+    if direction.dtype.kind in "iu":
+        return direction
+    names, inverse = np.unique(
+        np.char.lower(direction.astype(str)), return_inverse=True
+    )
+    codes = np.array([DIRECTIONS.index(name) for name in names], dtype=np.int8)
+    return codes[inverse].reshape(direction.shape)
+
+
+@dataclass
+class ConstructionTable:
+    """Many constructions stored column-wise. The layers of construction i
+    are rows offsets[i]:offsets[i + 1] of the layer table, the first layer
+    of every construction is external."""
+
+    offsets: ArrayLike  # Start of the layers of every construction and end of the last
+    thickness: ArrayLike  # Layer table [m]
+    conductivity: ArrayLike  # Layer table [W/mK]
+    direction: ArrayLike  # Heat flow direction of every construction, name or code
+    surface_emissivity: ArrayLike = 0.9  # Layer table
+    mean_temperature: ArrayLike = 10  # Of every construction
+    wind_speed: ArrayLike = 4  # Of every construction [m/s]
+    names: ArrayLike = None
+
+    R: np.ndarray = field(init=False)
+    R_si: np.ndarray = field(init=False)
+    R_se: np.ndarray = field(init=False)
+    R_tot: np.ndarray = field(init=False)
+    U: np.ndarray = field(init=False)
+
+    @classmethod
+    def from_constructions(cls, constructions, direction, **kwargs):
+        """Columnar copy of Construction objects."""
+        layers = [
+            c.materials if iterable(c.materials) else [c.materials]
+            for c in constructions
+        ]
+        materials = [material for layer in layers for material in layer]
+        return cls(
+            offsets=np.cumsum([0] + [len(layer) for layer in layers]),
+            thickness=[material.thickness for material in materials],
+            conductivity=[material.conductivity for material in materials],
+            surface_emissivity=[material.surface_emissivity for material in materials],
+            direction=direction,
+            names=[c.name for c in constructions],
+            **kwargs,
+        )
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __post_init__(self) -> None:
+        self.offsets = np.asarray(self.offsets, dtype=np.int64)
+        n = len(self)
+        n_layers = self.offsets[-1]
+        self.thickness, self.conductivity, self.surface_emissivity = (
+            np.broadcast_to(np.asarray(x, dtype=float), n_layers)
+            for x in (self.thickness, self.conductivity, self.surface_emissivity)
+        )
+        self.direction = np.broadcast_to(direction_code(self.direction), n)
+        self.mean_temperature, self.wind_speed = (
+            np.broadcast_to(np.asarray(x, dtype=float), n)
+            for x in (self.mean_temperature, self.wind_speed)
+        )
+
+        # segment sums of the layer resistances, constructions may have no layers
+        counts = np.diff(self.offsets)
+        construction = np.repeat(np.arange(n), counts)
+        R = f.R(self.thickness, self.conductivity)
+        self.R = np.bincount(construction, weights=R, minlength=n)
+
+        # external surface of the first layer, internal surface of the last one,
+        # constructions without layers point past the table to a NaN
+        empty = counts == 0
+        epsilon = np.append(self.surface_emissivity, np.nan)
+        epsilon_e = epsilon[np.where(empty, n_layers, self.offsets[:-1])]
+        epsilon_i = epsilon[np.where(empty, n_layers, self.offsets[1:] - 1)]
+
+        h_ci = np.array([f.h_ci(direction) for direction in DIRECTIONS])
+        h_r0 = f.h_r0(T_mn=self.mean_temperature + 273.15)
+        self.R_si = f.R_s(h_ci[self.direction], f.h_r(epsilon_i, h_r0))
+        self.R_se = f.R_s(f.h_ce(self.wind_speed), f.h_r(epsilon_e, h_r0))
+        # function 4
+        self.R_tot = self.R_si + self.R + self.R_se
+        self.U = f.U1(self.R_tot)
+
+
+@dataclass
+class InhomogeneousComponent:
+    """Components of homogeneous and inhomogeneous layers (6.7.2) of many
+    variants at once. Leading axes are variants, conductivities have shape
+    (..., sections, layers), area fractions (..., sections) and thicknesses
+    (..., layers). The lower limit uses function 7, or functions 8 and 9
+    with method="conductivity"."""
+
+    thickness: ArrayLike  # [m]
+    conductivity: ArrayLike  # [W/mK]
+    f_q: ArrayLike  # Fractional area of every section
+    R_si: ArrayLike = 0.13
+    R_se: ArrayLike = 0.04
+    method: str = "resistance"
+
+    R_tot_upper: np.ndarray = field(init=False)
+    R_tot_lower: np.ndarray = field(init=False)
+    R_tot: np.ndarray = field(init=False)
+    e: np.ndarray = field(init=False)  # Maximum relative error [%]
+    U: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        d = np.asarray(self.thickness, dtype=float)[..., None, :]
+        k = np.asarray(self.conductivity, dtype=float)
+        f_q = np.asarray(self.f_q, dtype=float)[..., :, None]
+        d, k, f_q = np.broadcast_arrays(d, k, f_q)
+
+        # sections and layers first, the functions sum over the first axis
+        d, k, f_q = (np.moveaxis(x, (-2, -1), (0, 1)) for x in (d, k, f_q))
+        R_qj = f.R(d, k)
+
+        R_tot_q = self.R_si + R_qj.sum(axis=1) + self.R_se
+        self.R_tot_upper = f.R_tot_upper(f_q[:, 0], R_tot_q)
+
+        if self.method == "resistance":
+            R_j = f.R_j1(f_q, R_qj)
+        elif self.method == "conductivity":
+            R_j = f.R_j2(d[0], f.k_eq_j(k, f_q))
+        else:
+            raise ValueError(f"Unknown method of the lower limit: {self.method}")
+        self.R_tot_lower = self.R_si + R_j.sum(axis=0) + self.R_se
+
+        self.R_tot = f.R_tot2(self.R_tot_upper, self.R_tot_lower)
+        self.e = f.e(self.R_tot_upper, self.R_tot_lower)
+        self.U = f.U1(self.R_tot)
+
+
+@dataclass
+class TransmittanceCorrections:
+    """Annex F corrections of the constructions of a ConstructionTable.
+    The inputs broadcast against each other and against the constructions
+    on the last axis, e.g. fastener layouts of shape (layouts, 1) against
+    all constructions."""
+
+    constructions: ConstructionTable
+    layer: ArrayLike = 0  # Index of the corrected layer within every construction
+    air_voids: ArrayLike = 0  # Level of air voids, Table F.1
+    n_f: ArrayLike = 0  # Number of fasteners per m2
+    k_f: ArrayLike = 50  # Thermal conductivity of the fasteners [W/mK]
+    A_f: ArrayLike = 0  # Cross-sectional area of one fastener [m2]
+    d_0: ArrayLike = (
+        0  # Length of recessed fasteners in the layer, 0 if penetrating [m]
+    )
+    p: ArrayLike = 0  # Mean rainfall during the heating season [mm/day]
+    f_r: ArrayLike = 0.75  # Drainage factor of the inverted roof
+    x_r: ArrayLike = 0.04  # Factor for increased heat loss [W*day/m2*K*mm]
+
+    deltaU_g: np.ndarray = field(init=False)
+    deltaU_f: np.ndarray = field(init=False)
+    deltaU_r: np.ndarray = field(init=False)
+    deltaU: np.ndarray = field(init=False)
+    U_c: np.ndarray = field(init=False)  # Corrected thermal transmittance
+
+    def __post_init__(self) -> None:
+        table = self.constructions
+        row = table.offsets[:-1] + np.asarray(self.layer)
+        if np.any(row >= table.offsets[1:]):
+            raise IndexError("Corrected layer outside of its construction.")
+        d_1 = table.thickness[row]
+        R_1 = f.R(d_1, table.conductivity[row])
+        R_tot = table.R_tot
+
+        self.deltaU_g = f.deltaU_g(f.deltaU_bis(self.air_voids), R_1, R_tot)
+        self.deltaU_f = f.deltaU_f2(
+            self.k_f, self.A_f, self.n_f, R_1, R_tot, d_1, self.d_0
+        )
+        self.deltaU_r = f.deltaU_r(self.p, self.f_r, self.x_r, R_1, R_tot)
+        self.deltaU = f.deltaU(self.deltaU_g, self.deltaU_f, self.deltaU_r)
+        self.U_c = f.U_c(table.U, self.deltaU)
+
+
+@dataclass
+class AirCavity:
+    """Unventilated air layers (Annex D) of many cavities evaluated at once,
+    the inputs broadcast against each other."""
+
+    thickness: ArrayLike  # Thickness of the air layer in the heat flow direction [m]
+    direction: ArrayLike  # Heat flow direction by name or code
+    deltaT: ArrayLike = 5.0  # Temperature difference across the air layer [K]
+    epsilon_1: ArrayLike = 0.9  # Hemispherical emissivity of the first surface
+    epsilon_2: ArrayLike = 0.9  # Hemispherical emissivity of the second surface
+    mean_temperature: ArrayLike = 10  # Mean temperature of the air layer [*C]
+    width: ArrayLike = np.inf  # Width of the air layer [m]
+
+    E: np.ndarray = field(init=False)  # Intersurface emittance
+    h_a: np.ndarray = field(init=False)  # Conduction/convection coefficient [W/m2K]
+    h_r: np.ndarray = field(init=False)  # Radiative coefficient [W/m2K]
+    R: np.ndarray = field(init=False)  # Thermal resistance of the air layer [m2K/W]
+    R_table: np.ndarray = field(init=False)  # Table 8 for high emissivity surfaces
+
+    def __post_init__(self) -> None:
+        d = np.asarray(self.thickness, dtype=float)
+        code = direction_code(self.direction)
+        self.direction = code
+
+        # upwards is 0 and horizontal 90 degrees of function D.2
+        alfa = np.where(code == 0, 0.0, 90.0)
+        self.h_a = np.where(
+            code == 2, f.h_a_down(self.deltaT, d), f.h_a(self.deltaT, d, alfa)
+        )
+
+        h_r0 = f.h_r0(np.asarray(self.mean_temperature, dtype=float) + 273.15)
+        self.E = f.E(self.epsilon_1, self.epsilon_2)
+        # functions D.5 and D.6 for air layers narrower than 10 times their thickness
+        small = np.asarray(self.width) < 10 * d
+        self.h_r = np.where(
+            small,
+            f.h_r2(h_r0, self.epsilon_1, self.epsilon_2, d, self.width),
+            f.h_r1(self.E, h_r0),
+        )
+        self.R = np.where(small, f.R_a2(self.h_a, self.h_r), f.R_a1(self.h_a, self.h_r))
+        self.R_table = f.R_unve_air(d * 1000, code)
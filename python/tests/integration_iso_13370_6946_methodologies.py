@@ -16,11 +16,35 @@ ClassA = SlabOnGroundFloor(
     R_f_sog=1,
 )
 
-# ClassB = SuspendedFloor("FloorA", 100, 40, GroundA)
-# ClassC = HeatedBasement("FloorA", 100, 40, GroundA)
-# ClassD = UnheatedBasement("FloorA", 100, 40, GroundA)
+ClassB = SuspendedFloor("FloorA", 100, 40, GroundA)
+ClassC = HeatedBasement("FloorA", 100, 40, GroundA)
+ClassD = UnheatedBasement("FloorA", 100, 40, GroundA)
 
 pprint(ClassA)
-# print(ClassB)
-# print(ClassC)
-# print(ClassD)
+print(ClassB)
+print(ClassC)
+print(ClassD)
+
+# monthly heat flow of the floor for two external temperature amplitudes
+Monthly = MonthlyGroundHeatFlow.from_floors([ClassA, ClassA], t_e_amp=[10, 8])
+print("Phi_m:", Monthly.Phi_m.round(1))
+print("Phi_s_h:", Monthly.Phi_s_h, "Phi_s_c:", Monthly.Phi_s_c)
+
+# the same slab for a range of floor areas, the floor resistance from the construction
+Slabs = ConstructionTable.from_constructions([ConstructionA] * 3, ["downwards"] * 3)
+ClassA_batch = SlabOnGroundFloorBatch(
+    area=[50, 100, 200],
+    perimeter=40,
+    conductivity=GroundA.conductivity,
+    d_w_e=0.2,
+    constructions=Slabs,
+)
+print("U_fg_sog:", ClassA_batch.U_fg_sog)
+
+# estate of mixed foundations, insulated basements in batches, in one monthly pass
+Basements = HeatedBasementBatch(
+    area=[80, 120], perimeter=[36, 44], conductivity=2.0, R_f_b=2.0, R_w_b=2.5
+)
+Estate = MonthlyGroundHeatFlow.from_floors([ClassA, ClassB, ClassD, Basements])
+print("U basements:", Basements.U)
+print("Phi_max:", Estate.Phi_max)
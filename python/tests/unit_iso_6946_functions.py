@@ -5,3 +5,5 @@ print("R_tot =", R_tot1(0.17, 2, 0.04))
 
 for direction in ["upwards", "horizontal", "downwards"]:
     print(f"h_ci_{direction} =", h_ci(direction))
+
+print("e =", e(R_tot_upper=3.48, R_tot_lower=3.36), "%")
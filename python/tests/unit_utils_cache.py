@@ -0,0 +1,18 @@
+from utils.cache import LRUCache
+
+cache = LRUCache(maxsize=2)
+calls = []
+
+def square(x):
+    calls.append(x)
+    return x * x
+
+for x in [1, 2, 1, 3, 2, 1]:
+    print(x, cache.get(x, lambda: square(x)))
+
+# 2 was evicted by 3 and computed again, which in turn evicted 1
+assert calls == [1, 2, 3, 2, 1]
+assert cache.info() == {"hits": 1, "misses": 5, "maxsize": 2, "currsize": 2}
+
+cache.clear()
+assert len(cache) == 0 and cache.hits == cache.misses == 0
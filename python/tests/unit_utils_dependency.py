@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+from utils.dependency import Node
+
+
+@dataclass
+class Layer(Node):
+    thickness: float
+    conductivity: float
+    R: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.R = self.thickness / self.conductivity
+
+
+@dataclass
+class Wall(Node):
+    layers: list
+    U: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.depends_on(*self.layers)
+        self.U = 1 / sum(layer.R for layer in self.layers)
+
+
+brick, insulation = Layer(0.25, 0.8), Layer(0.1, 0.04)
+wall = Wall([brick, insulation])
+print("U =", wall.U)
+
+insulation.thickness = 0.2
+assert insulation.dirty and wall.dirty and not brick.dirty
+print("U =", wall.U)
+assert not wall.dirty and not insulation.dirty
+assert abs(wall.U - 1 / (0.25 / 0.8 + 0.2 / 0.04)) < 1e-12
+
+
+# a node registered on a dirty node is still invalidated by its changes
+@dataclass
+class Cavity(Node):
+    layer: Layer
+    width: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.depends_on(self.layer)
+        # reads an input only, the layer stays dirty
+        self.width = 0.5 - self.layer.thickness
+
+
+insulation.thickness = 0.3
+cavity = Cavity(insulation)
+assert insulation.dirty and not cavity.dirty
+insulation.thickness = 0.4
+assert cavity.dirty
+assert abs(cavity.width - 0.1) < 1e-12
+print("width =", cavity.width)
+
+# copies recompute on first access and track their own layers
+import pickle
+
+copy = pickle.loads(pickle.dumps(wall))
+copy.layers[0].thickness = 0.5
+assert copy.U != wall.U
+print("U =", copy.U)
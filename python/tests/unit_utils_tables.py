@@ -0,0 +1,43 @@
+from utils.tables import tables
+import iso_11855.functions
+import iso_6946.functions
+
+print("Registered tables:", len(tables))
+
+tables.warm_up()
+assert all(state["built"] for state in tables.info().values())
+
+tables.clear("iso_6946")
+assert not any(state["built"] for state in tables.info("iso_6946").values())
+assert all(state["built"] for state in tables.info("iso_11855").values())
+
+print(iso_6946.functions.R_unve_air(10, "upwards"))
+print(iso_11855.functions.a_W1(0.1))
+
+# registering a table again replaces it and drops the built interpolator
+builder = tables._builders["iso_6946.R_unve_air"]
+tables.warm_up("iso_6946")
+tables.register("iso_6946.R_unve_air")(builder)
+assert not tables.info("iso_6946")["iso_6946.R_unve_air"]["built"]
+assert len(tables.names("iso_6946.R_unve_air")) == 1
+print(iso_6946.functions.R_unve_air(10, "upwards"))
+
+# the cubic grid tables agree with the interp2d they replaced
+import warnings
+import numpy as np
+from scipy.interpolate import interp2d
+from utils.interpolation import GridInterpolator
+
+for name in tables.names():
+    table = tables.get(name)
+    if not isinstance(table, GridInterpolator) or len(table.grid) != 2:
+        continue
+    y, x = table.grid
+    points_y = np.linspace(y[0], y[-1], 200)
+    points_x = np.linspace(x[0], x[-1], 200)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        expected = interp2d(x, y, table.values, kind="cubic")(points_x, points_y)
+    actual = table(*np.meshgrid(points_y, points_x, indexing="ij"))
+    assert np.allclose(actual, expected, rtol=1e-10, atol=1e-15), name
+print("Grid tables agree with interp2d")
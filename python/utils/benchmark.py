@@ -0,0 +1,81 @@
+import json
+import platform
+import time
+import tracemalloc
+import numpy as np
+from dataclasses import dataclass, asdict
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    items: int  # Items processed by one run of the workload
+    runs: int
+    throughput: float  # Items per second at the median run time [1/s]
+    p50: float  # Median run time [s]
+    p99: float  # 99th percentile of the run time [s]
+    peak_memory: float  # Peak memory allocated by one run [MB]
+
+
+def measure(name, workload, items, runs=10, warm_up=1):
+    """Time repeated runs of a workload and trace the memory of one more run."""
+    for _ in range(warm_up):
+        workload()
+
+    times = np.empty(runs)
+    for i in range(runs):
+        start = time.perf_counter()
+        workload()
+        times[i] = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        workload()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    p50, p99 = np.percentile(times, [50, 99])
+    return BenchmarkResult(
+        name=name,
+        items=items,
+        runs=runs,
+        throughput=items / p50,
+        p50=p50,
+        p99=p99,
+        peak_memory=peak / 1e6,
+    )
+
+
+def save(path, results):
+    """Write results as a JSON baseline."""
+    data = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+
+
+def load(path):
+    """Results of a JSON baseline by workload name."""
+    with open(path) as file:
+        data = json.load(file)
+    return {name: BenchmarkResult(**x) for name, x in data["results"].items()}
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Regressions against the baseline, a workload regresses when its median
+    run time or peak memory grows by more than the tolerance."""
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        for metric in ("p50", "peak_memory"):
+            ratio = getattr(result, metric) / getattr(base, metric)
+            if ratio > 1 + tolerance:
+                regressions.append((result.name, metric, ratio))
+    return regressions
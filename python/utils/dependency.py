@@ -0,0 +1,102 @@
+import weakref
+from dataclasses import fields
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _fields(cls):
+    """Names of the input (init) and derived (init=False) fields of a dataclass."""
+    inputs = frozenset(x.name for x in fields(cls) if x.init)
+    derived = tuple(x.name for x in fields(cls) if not x.init)
+    return inputs, derived
+
+
+class Node:
+    """Dataclass mixin of a dependency graph whose derived fields are
+    computed in __post_init__.
+
+    Setting an input field of a computed node drops its derived fields
+    and marks everything depending on it dirty. A dirty node reruns its
+    __post_init__ on the next access of a derived field, so only the
+    part of the graph reachable from a change is recomputed, and only
+    when it is read. A change of an already dirty node still reaches
+    the nodes that registered on it after it became dirty.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        post_init = cls.__dict__.get("__post_init__")
+        if post_init is None:
+            return
+
+        def __post_init__(self):
+            if "_inputs" not in cls.__dict__:
+                cls._inputs, cls._derived = _fields(cls)
+            # input fields set while computing do not invalidate the node
+            self.__dict__["_dirty"] = None
+            post_init(self)
+            self.__dict__["_dirty"] = False
+
+        cls.__post_init__ = __post_init__
+
+    def depends_on(self, *nodes):
+        """Invalidate this node whenever one of the nodes changes."""
+        for node in nodes:
+            dependents = node.__dict__.setdefault("_dependents", {})
+            dependents[id(self)] = weakref.ref(self)
+
+    def invalidate(self, _seen=None):
+        """Drop the derived fields of this node and of all its dependents."""
+        # nodes being computed, or never computed, have nothing to drop
+        if self.__dict__.get("_dirty") is None:
+            return
+        seen = set() if _seen is None else _seen
+        if id(self) in seen:
+            return
+        seen.add(id(self))
+        if self.__dict__["_dirty"] is False:
+            self.__dict__["_dirty"] = True
+            for name in self._derived:
+                self.__dict__.pop(name, None)
+
+        # dependents are walked even from a dirty node, they may have
+        # registered and computed since it became dirty
+        dependents = self.__dict__.get("_dependents", {})
+        for key, ref in list(dependents.items()):
+            node = ref()
+            if node is None:
+                del dependents[key]
+            else:
+                node.invalidate(seen)
+
+    def __getstate__(self):
+        # links to dependents are weak and rebuilt when the copies recompute
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name != "_dependents" and name not in self._derived
+        }
+        state["_dirty"] = True
+        return state
+
+    @property
+    def dirty(self):
+        return self.__dict__.get("_dirty") is True
+
+    def __setattr__(self, name, value):
+        state = self.__dict__
+        state[name] = value
+        if state.get("_dirty") is not None and name in self._inputs:
+            self.invalidate()
+
+    def __getattr__(self, name):
+        # only reached for missing attributes, i.e. derived fields of a dirty node
+        if self.__dict__.get("_dirty") and name in self._derived:
+            self.__post_init__()
+            try:
+                return self.__dict__[name]
+            except KeyError:
+                pass
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
@@ -0,0 +1,67 @@
+class TableRegistry:
+    """Lazily built interpolators for the tabulated values of the standards.
+
+    Each table is registered with a builder returning a callable
+    interpolator. The builder is executed on first use and its result
+    is kept for the life of the process.
+    """
+
+    def __init__(self):
+        self._builders = {}
+        self._cache = {}
+
+    def register(self, name):
+        """Decorator registering the builder of the table `name`."""
+
+        def decorator(builder):
+            # a module imported again, e.g. as `functions` by the examples
+            # run from its package directory, replaces its tables
+            self._builders[name] = builder
+            self._cache.pop(name, None)
+            return builder
+
+        return decorator
+
+    def get(self, name):
+        """Interpolator of the table `name`, built on first use."""
+        try:
+            return self._cache[name]
+        except KeyError:
+            interpolator = self._builders[name]()
+            self._cache[name] = interpolator
+            return interpolator
+
+    def names(self, prefix=""):
+        """Names of the registered tables starting with `prefix`."""
+        return [name for name in self._builders if name.startswith(prefix)]
+
+    def info(self, prefix=""):
+        """Built state and interpolator type of the registered tables."""
+        return {
+            name: {
+                "built": name in self._cache,
+                "type": (
+                    type(self._cache[name]).__name__ if name in self._cache else None
+                ),
+            }
+            for name in self.names(prefix)
+        }
+
+    def warm_up(self, prefix=""):
+        """Build all tables starting with `prefix` in advance."""
+        for name in self.names(prefix):
+            self.get(name)
+
+    def clear(self, prefix=""):
+        """Drop the cached interpolators starting with `prefix`."""
+        for name in self.names(prefix):
+            self._cache.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._builders
+
+    def __len__(self):
+        return len(self._builders)
+
+
+tables = TableRegistry()